@@ -1224,8 +1224,7 @@ class BattleScreen:
         self.turn_order_tracker.update(self.mouse_pos)
 
         # Update investigator tiles (hover effects)
-        for tile in self.investigator_tiles:
-            tile.update(self.mouse_pos)
+        InvestigatorTile.update_all(self.investigator_tiles, self.mouse_pos)
 
         # Update action bar (hover effects)
         self.action_bar.update(self.mouse_pos)
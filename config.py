@@ -41,6 +41,11 @@ VISUAL_STYLE = "emoji"  # Default to emoji if available
 # "symbols" = Show emoji/ASCII symbols for all units
 GRID_DISPLAY_MODE = "portraits"  # Default to portraits for better visual clarity
 
+# Pre-scaled portrait cache (written on first load, or ahead of time with
+# scripts/prebake_portraits.py). Loading a small PNG is much cheaper than
+# decoding the full-size source and scaling it down on every launch.
+PORTRAIT_CACHE_DIR = "assets/cache/portraits"
+
 # ============================================================================
 # GRID SETTINGS (for tactical combat - Phase 1)
 # ============================================================================
@@ -0,0 +1,50 @@
+"""
+Pre-scale every investigator portrait to the sizes the UI draws them at.
+
+The battle screen's InvestigatorTile loads each portrait through
+ui.ui_elements._load_portrait, which writes a scaled copy to
+config.PORTRAIT_CACHE_DIR the first time it sees a (portrait, size) pair.
+Running this script once (e.g. after adding new portraits) fills that cache
+ahead of time, so the first battle doesn't pay for the scaling either.
+
+Run with: uv run python scripts/prebake_portraits.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pathlib import Path
+
+import pygame
+from ui.ui_elements import _load_portrait, _prebaked_portrait_path
+
+
+PORTRAIT_DIR = Path("assets/images/investigators")
+
+# Portrait sizes used by the UI:
+# InvestigatorTile on the battle screen is 510x180 -> min(510 // 3, 180 - 10) = 170
+PORTRAIT_SIZES = (170,)
+
+
+def prebake_portraits():
+    """Scale every portrait PNG and write it to the portrait cache."""
+    sources = sorted(PORTRAIT_DIR.glob("*/*.png"))
+    for path in sources:
+        for size in PORTRAIT_SIZES:
+            _load_portrait(str(path), size)
+            print(f"[OK] {path} -> {_prebaked_portrait_path(str(path), size)}")
+
+    print(f"\nPrebaked {len(sources)} portraits at {len(PORTRAIT_SIZES)} size(s)")
+
+
+if __name__ == "__main__":
+    # Paths in config and investigator data are relative to the project root
+    os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    pygame.init()
+    try:
+        prebake_portraits()
+    finally:
+        pygame.quit()
@@ -0,0 +1,97 @@
+"""
+Test script for ActionButton icon and label layout.
+
+The icon is centered in the button; the label sits 5px above the bottom
+edge below an icon, or is centered when there is no icon. Positions come
+from the rendered text surfaces, whose height is larger than the font's
+size() height.
+
+Run with: uv run python testing/test_action_button.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+import config
+from ui.ui_elements import ActionButton, _render_text
+
+
+SIZE = 70  # ActionBar's default button size
+
+
+def test_icon_and_label_layout():
+    """Icon centered, label centered 5px above the bottom edge."""
+    print("=" * 60)
+    print("TEST 1: Icon And Label Layout")
+    print("=" * 60)
+
+    button = ActionButton(100, 900, SIZE, text="Attack", icon="X")
+    local_rect = pygame.Rect(0, 0, SIZE, SIZE)
+    icon_surface = _render_text("X", SIZE // 2, config.COLOR_TEXT)
+    text_surface = _render_text("Attack", 22, config.COLOR_TEXT)
+
+    icon_rect, text_rect = button._content_rects(local_rect, icon_surface, text_surface)
+
+    icon_w, icon_h = icon_surface.get_size()
+    assert icon_rect.topleft == (SIZE // 2 - icon_w // 2, SIZE // 2 - icon_h // 2), icon_rect
+    print(f"[OK] Icon centered at {icon_rect.topleft}")
+
+    text_w, text_h = text_surface.get_size()
+    assert text_rect.topleft == (SIZE // 2 - text_w // 2, SIZE - 5 - text_h), text_rect
+    assert text_rect.bottom == SIZE - 5
+    print(f"[OK] Label bottom 5px above the button edge at {text_rect.topleft}")
+
+
+def test_label_without_icon():
+    """Without an icon the label is centered in the button."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Label Without Icon")
+    print("=" * 60)
+
+    button = ActionButton(100, 900, SIZE, text="Move")
+    local_rect = pygame.Rect(0, 0, SIZE, SIZE)
+    text_surface = _render_text("Move", 22, config.COLOR_TEXT)
+
+    icon_rect, text_rect = button._content_rects(local_rect, None, text_surface)
+
+    assert icon_rect is None
+    text_w, text_h = text_surface.get_size()
+    assert text_rect.topleft == (SIZE // 2 - text_w // 2, SIZE // 2 - text_h // 2), text_rect
+    print(f"[OK] Label centered at {text_rect.topleft}")
+
+
+def run_all_tests():
+    """Run all action button tests."""
+    print()
+    print("=" * 60)
+    print("          ACTION BUTTON TESTS")
+    print("=" * 60)
+    print()
+
+    pygame.init()
+    try:
+        test_icon_and_label_layout()
+        test_label_without_icon()
+
+        print("\n" + "=" * 60)
+        print("[OK] ALL TESTS PASSED!")
+        print("=" * 60)
+        print()
+
+    except Exception as e:
+        print("\n" + "=" * 60)
+        print("[X] TEST FAILED!")
+        print("=" * 60)
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,103 @@
+"""
+Test script for Dropdown arrow direction and option hover.
+
+Regression test for the arrow bug in Dropdown.draw: the collapsed branch
+assigned the arrow points twice, so the second (upward) polygon always won.
+
+Run with: uv run python testing/test_dropdown.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from ui.ui_elements import Dropdown
+
+
+class FakeClick:
+    """Minimal left mouse button press event."""
+    type = pygame.MOUSEBUTTONDOWN
+    button = 1
+
+
+def test_arrow_direction():
+    """Collapsed dropdown points down, expanded dropdown points up."""
+    print("=" * 60)
+    print("TEST 1: Dropdown Arrow Direction")
+    print("=" * 60)
+
+    dropdown = Dropdown(100, 100, 300, [("720p", 1), ("1080p", 2), ("1440p", 3)])
+
+    # The apex is the first point, the base is the other two
+    down_apex, down_left, down_right = dropdown._arrow_down
+    up_apex, up_left, up_right = dropdown._arrow_up
+
+    assert down_apex[1] > down_left[1] == down_right[1], "Down arrow apex must be below its base"
+    assert up_apex[1] < up_left[1] == up_right[1], "Up arrow apex must be above its base"
+    print("[OK] Down arrow points down, up arrow points up")
+
+    assert dropdown._arrow_up != dropdown._arrow_down
+    print("[OK] Expanded and collapsed arrows differ")
+
+
+def test_option_hover():
+    """Hovered option is found from the mouse position when expanded."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Dropdown Option Hover")
+    print("=" * 60)
+
+    dropdown = Dropdown(100, 100, 300, [("720p", 1), ("1080p", 2), ("1440p", 3)])
+
+    # Open the dropdown by clicking the main button
+    dropdown.update(dropdown.main_rect.center)
+    dropdown.handle_event(FakeClick())
+    assert dropdown.is_expanded
+    print("[OK] Click on main button expands the dropdown")
+
+    for i, rect in enumerate(dropdown.option_rects):
+        dropdown.update(rect.center)
+        assert dropdown.hovered_option == i, f"Expected option {i}, got {dropdown.hovered_option}"
+        # Bottom edge belongs to the next option (Rect bottom is exclusive)
+        dropdown.update((rect.centerx, rect.bottom - 1))
+        assert dropdown.hovered_option == i
+    print(f"[OK] All {len(dropdown.option_rects)} options hover correctly")
+
+    dropdown.update((0, 0))
+    assert dropdown.hovered_option == -1
+    print("[OK] No option hovered outside the list")
+
+
+def run_all_tests():
+    """Run all dropdown tests."""
+    print()
+    print("=" * 60)
+    print("          DROPDOWN TESTS")
+    print("=" * 60)
+    print()
+
+    pygame.init()
+    try:
+        test_arrow_direction()
+        test_option_hover()
+
+        print("\n" + "=" * 60)
+        print("[OK] ALL TESTS PASSED!")
+        print("=" * 60)
+        print()
+
+    except Exception as e:
+        print("\n" + "=" * 60)
+        print("[X] TEST FAILED!")
+        print("=" * 60)
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,91 @@
+"""
+Test script for splitting investigator names over two tile lines.
+
+InvestigatorTile shows "First 'Nick'" on line 1 and the last name on
+line 2 (see ui.ui_elements._split_name).
+
+Run with: uv run python testing/test_name_split.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ui.ui_elements import _split_name
+from entities.investigator import generate_random_name
+
+
+def test_name_formats():
+    """Each supported name format splits as expected."""
+    print("=" * 60)
+    print("TEST 1: Name Formats")
+    print("=" * 60)
+
+    cases = [
+        ("Arthur Blackwood", ("Arthur", "Blackwood")),
+        ("Arthur 'Bones' Blackwood", ("Arthur 'Bones'", "Blackwood")),
+        ("Mary Anne Smith", ("Mary Anne", "Smith")),
+        ("Harriet 'Two Guns' Doyle", ("Harriet 'Two Guns'", "Doyle")),
+        ("Houdini", ("Houdini", "")),
+    ]
+    for full_name, expected in cases:
+        result = _split_name(full_name)
+        assert result == expected, f"{full_name!r}: expected {expected}, got {result}"
+        print(f"[OK] {full_name!r} -> {result}")
+
+
+def test_generated_names():
+    """Generated names always get a last name on line 2."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Generated Names")
+    print("=" * 60)
+
+    for _ in range(50):
+        full_name, _ = generate_random_name()
+        first_line, second_line = _split_name(full_name)
+        assert first_line and second_line, f"Bad split for {full_name!r}"
+        assert f"{first_line} {second_line}" == " ".join(full_name.split())
+    print("[OK] 50 generated names split into two non-empty lines")
+
+
+def test_cached():
+    """The same name returns the same cached result."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Cached Result")
+    print("=" * 60)
+
+    assert _split_name("Arthur 'Bones' Blackwood") is _split_name("Arthur 'Bones' Blackwood")
+    print("[OK] Repeated split returns the cached tuple")
+
+
+def run_all_tests():
+    """Run all name split tests."""
+    print()
+    print("=" * 60)
+    print("          NAME SPLIT TESTS")
+    print("=" * 60)
+    print()
+
+    try:
+        test_name_formats()
+        test_generated_names()
+        test_cached()
+
+        print("\n" + "=" * 60)
+        print("[OK] ALL TESTS PASSED!")
+        print("=" * 60)
+        print()
+
+    except Exception as e:
+        print("\n" + "=" * 60)
+        print("[X] TEST FAILED!")
+        print("=" * 60)
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,105 @@
+"""
+Test script for Separator pixel placement.
+
+Separator draws a pre-filled strip instead of calling pygame.draw.line()
+every frame; the strip must cover exactly the pixels draw.line() would,
+for both odd and even thicknesses.
+
+Run with: uv run python testing/test_separator.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from ui.ui_elements import Separator
+
+
+BACKGROUND = (0, 0, 0)
+COLOR = (200, 180, 120)
+
+
+def covered_pixels(surface):
+    """Return the set of (x, y) pixels that are not background."""
+    width, height = surface.get_size()
+    return {
+        (x, y)
+        for y in range(height)
+        for x in range(width)
+        if surface.get_at((x, y))[:3] != BACKGROUND
+    }
+
+
+def test_matches_draw_line():
+    """Separator covers the same pixels as draw.line for thickness 1-4."""
+    print("=" * 60)
+    print("TEST 1: Separator Matches draw.line")
+    print("=" * 60)
+
+    x, y, width = 10, 20, 50
+    for thickness in (1, 2, 3, 4):
+        expected = pygame.Surface((80, 40))
+        expected.fill(BACKGROUND)
+        pygame.draw.line(expected, COLOR, (x, y), (x + width, y), thickness)
+
+        actual = pygame.Surface((80, 40))
+        actual.fill(BACKGROUND)
+        Separator(x, y, width, thickness, COLOR).draw(actual)
+
+        expected_pixels = covered_pixels(expected)
+        actual_pixels = covered_pixels(actual)
+        assert actual_pixels == expected_pixels, (
+            f"thickness={thickness}: rows {sorted({p[1] for p in actual_pixels})}, "
+            f"expected {sorted({p[1] for p in expected_pixels})}"
+        )
+        print(f"[OK] thickness={thickness} covers the same pixels as draw.line")
+
+
+def test_set_position():
+    """A moved separator covers the same pixels as one created there."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Separator set_position")
+    print("=" * 60)
+
+    for thickness in (2, 3):
+        moved = Separator(0, 0, 50, thickness, COLOR)
+        moved.set_position(10, 20)
+        created = Separator(10, 20, 50, thickness, COLOR)
+        assert moved._rect == created._rect, f"{moved._rect} != {created._rect}"
+        print(f"[OK] thickness={thickness} set_position matches the constructor")
+
+
+def run_all_tests():
+    """Run all separator tests."""
+    print()
+    print("=" * 60)
+    print("          SEPARATOR TESTS")
+    print("=" * 60)
+    print()
+
+    pygame.init()
+    try:
+        test_matches_draw_line()
+        test_set_position()
+
+        print("\n" + "=" * 60)
+        print("[OK] ALL TESTS PASSED!")
+        print("=" * 60)
+        print()
+
+    except Exception as e:
+        print("\n" + "=" * 60)
+        print("[X] TEST FAILED!")
+        print("=" * 60)
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -17,7 +17,7 @@ Key Concepts:
 import pygame
 from typing import Optional
 import config
-from ui.ui_elements import MenuButton, TextLabel, RadioButton, Separator, Dropdown
+from ui.ui_elements import MenuButton, TextLabel, RadioButton, RadioGroup, Separator, Dropdown, BUTTON_EVENT_TYPES, REDRAW_EVENT_TYPES, draw_batch, dirty_rects
 
 
 class SettingsScreen:
@@ -152,7 +152,7 @@ class SettingsScreen:
         )
         self.labels.append(fullscreen_label)
 
-        self.fullscreen_group = []
+        self.fullscreen_group = RadioGroup()
         radio_y = fullscreen_y + 45
 
         fullscreen_on = RadioButton(
@@ -190,7 +190,7 @@ class SettingsScreen:
         )
         self.labels.append(fps_label)
 
-        self.fps_group = []
+        self.fps_group = RadioGroup()
         fps_radio_y = fps_y + 45
 
         fps_on = RadioButton(
@@ -256,7 +256,7 @@ class SettingsScreen:
         )
         self.labels.append(visual_label)
 
-        self.visual_group = []
+        self.visual_group = RadioGroup()
         visual_radio_y = visual_y + 45
 
         # ASCII option
@@ -332,6 +332,10 @@ class SettingsScreen:
             center=True
         )
 
+        # Redraw tracking: skip drawing and flipping while nothing changes
+        self._last_signature = None
+        self._needs_redraw = True  # Always draw the first frame
+
     def _get_resolution_name(self, width: int, height: int) -> str:
         """Get a friendly name for a resolution."""
         if height == 720:
@@ -444,12 +448,20 @@ class SettingsScreen:
             if event.type == pygame.QUIT:
                 self._on_back()  # Save settings before exit
 
+            # Window uncovered/restored - draw everything again
+            if event.type in REDRAW_EVENT_TYPES:
+                self._needs_redraw = True
+
             # Keyboard shortcuts
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     # ESC returns to main menu
                     self._on_back()
 
+            # Widgets only react to mouse button events - skip forwarding the rest
+            if event.type not in BUTTON_EVENT_TYPES:
+                continue
+
             # Forward event to all dropdowns
             for dropdown in self.dropdowns:
                 dropdown.handle_event(event)
@@ -484,6 +496,19 @@ class SettingsScreen:
         for button in self.buttons:
             button.update(mouse_pos)
 
+    def state_signature(self) -> tuple:
+        """
+        Combined state of every interactive widget on screen.
+
+        Labels and separators never change, so if this is the same as last
+        frame the screen would look identical and run() skips drawing.
+        """
+        return (
+            tuple(dropdown.state_signature() for dropdown in self.dropdowns),
+            tuple(radio.state_signature() for radio in self.radio_buttons),
+            tuple(button.state_signature() for button in self.buttons),
+        )
+
     def draw(self) -> None:
         """
         Render the settings screen.
@@ -505,24 +530,19 @@ class SettingsScreen:
         self.title.draw(self.screen)
 
         # Layer 2.5: Draw separators
-        for separator in self.separators:
-            separator.draw(self.screen)
+        draw_batch(self.screen, self.separators)
 
         # Layer 3: Draw all labels
-        for label in self.labels:
-            label.draw(self.screen)
+        draw_batch(self.screen, self.labels)
 
         # Layer 4: Draw all dropdowns
-        for dropdown in self.dropdowns:
-            dropdown.draw(self.screen)
+        draw_batch(self.screen, self.dropdowns)
 
         # Layer 5: Draw all radio buttons
-        for radio in self.radio_buttons:
-            radio.draw(self.screen)
+        draw_batch(self.screen, self.radio_buttons)
 
         # Layer 6: Draw buttons (back button)
-        for button in self.buttons:
-            button.draw(self.screen)
+        MenuButton.draw_batch(self.screen, self.buttons)
 
         # Layer 7: Draw info text
         self.info_label.draw(self.screen)
@@ -551,11 +571,20 @@ class SettingsScreen:
             # 2. Update
             self.update()
 
-            # 3. Draw
-            self.draw()
-
-            # 4. Display (flip buffers)
-            pygame.display.flip()
+            # 3. Draw and 4. Display (flip buffers) - only if something changed
+            signature = self.state_signature()
+            if self._needs_redraw:
+                self.draw()
+                pygame.display.flip()
+                self._last_signature = signature
+                self._needs_redraw = False
+            elif signature != self._last_signature:
+                # Only some widgets changed: update just their screen areas
+                # (collected before draw() clears their dirty flags)
+                rects = dirty_rects(self.dropdowns + self.radio_buttons + self.buttons)
+                self.draw()
+                pygame.display.update(rects)
+                self._last_signature = signature
 
             # 5. Tick (maintain FPS)
             clock.tick(config.FPS)
@@ -18,7 +18,7 @@ import pygame
 import sys
 from typing import Optional
 import config
-from ui.ui_elements import MenuButton, TextLabel
+from ui.ui_elements import MenuButton, TextLabel, BUTTON_EVENT_TYPES, REDRAW_EVENT_TYPES, dirty_rects
 
 
 class TitleScreen:
@@ -166,6 +166,11 @@ class TitleScreen:
             center=True
         )
 
+        # Redraw tracking: the menu is static, so when no button changed
+        # since the last frame we can skip drawing and flipping entirely
+        self._last_signature = None
+        self._needs_redraw = True  # Always draw the first frame
+
     # ========================================================================
     # CALLBACK METHODS - Called when buttons are clicked
     # ========================================================================
@@ -227,6 +232,11 @@ class TitleScreen:
             if event.type == pygame.QUIT:
                 self.on_exit()
 
+            # ---- Window Uncovered/Restored ----
+            # The window contents may have been lost - draw everything again
+            if event.type in REDRAW_EVENT_TYPES:
+                self._needs_redraw = True
+
             # ---- Keyboard Shortcuts ----
             if event.type == pygame.KEYDOWN:  # Key was just pressed (not held)
                 if event.key == pygame.K_ESCAPE:
@@ -239,8 +249,10 @@ class TitleScreen:
             # ---- Forward Event to All Buttons ----
             # Each button checks if it was clicked
             # This is why using a list is convenient - we can loop through all buttons
-            for button in self.buttons:
-                button.handle_event(event)
+            # Buttons only react to mouse button events, so skip the loop for the rest
+            if event.type in BUTTON_EVENT_TYPES:
+                for button in self.buttons:
+                    button.handle_event(event)
 
     def update(self) -> None:
         """
@@ -256,6 +268,15 @@ class TitleScreen:
         for button in self.buttons:
             button.update(mouse_pos)
 
+    def state_signature(self) -> tuple:
+        """
+        Combined state of everything on screen that can change.
+
+        If this is the same as last frame, the screen would be drawn
+        exactly the same, so run() skips draw() and flip().
+        """
+        return tuple(button.state_signature() for button in self.buttons)
+
     def draw(self) -> None:
         """
         Render the title screen
@@ -282,8 +303,7 @@ class TitleScreen:
         self.subtitle.draw(self.screen)
 
         # ---- Layer 3: Draw all buttons ----
-        for button in self.buttons:
-            button.draw(self.screen)
+        MenuButton.draw_batch(self.screen, self.buttons)
 
         # ---- Layer 4: Draw flavor text ----
         self.flavor_text.draw(self.screen)
@@ -334,13 +354,24 @@ class TitleScreen:
             # ---- 2. Update ----
             self.update()  # Update button hover states
 
-            # ---- 3. Draw ----
-            self.draw()  # Render everything to hidden buffer
-
-            # ---- 4. Display ----
-            # Swap the hidden buffer to the visible screen
-            # This is "double buffering" - prevents flickering
-            pygame.display.flip()
+            # ---- 3. Draw & 4. Display (only if something changed) ----
+            signature = self.state_signature()
+            if self._needs_redraw:
+                self.draw()  # Render everything to hidden buffer
+
+                # Swap the hidden buffer to the visible screen
+                # This is "double buffering" - prevents flickering
+                pygame.display.flip()
+
+                self._last_signature = signature
+                self._needs_redraw = False
+            elif signature != self._last_signature:
+                # Only some buttons changed (e.g. hover): copy just their
+                # areas to the window. Collected before draw() clears them.
+                rects = dirty_rects(self.buttons)
+                self.draw()
+                pygame.display.update(rects)
+                self._last_signature = signature
 
             # ---- 5. Tick ----
             # Pause to maintain 60 FPS
@@ -12,11 +12,137 @@ Key Concepts Demonstrated:
 - Game Loop Integration: update() and draw() methods called every frame
 """
 
+import weakref
+from functools import lru_cache
+from pathlib import Path
+
 import pygame
-from typing import Callable, Optional, Tuple, List
+from typing import Any, Callable, Optional, Tuple, List
 import config
 
 
+# Event types that clickable widgets react to. Screens can check
+# "event.type in BUTTON_EVENT_TYPES" once before forwarding an event to
+# every widget, since all other events are ignored by handle_event().
+BUTTON_EVENT_TYPES = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+_DOWN_UP = frozenset(BUTTON_EVENT_TYPES)
+
+# Window events after which the whole screen must be redrawn, even if no
+# widget changed (screens that skip unchanged frames check these)
+REDRAW_EVENT_TYPES = frozenset((
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED,
+))
+
+# Module-level aliases for the colors and font sizes used in the menu
+# widgets' and InvestigatorTile's draw code. A global name lookup is cheaper
+# than "config.COLOR_..." (a global lookup plus a module attribute lookup) on
+# every frame. These never change at runtime, so binding them once at import
+# time is safe.
+_COL_BTN = config.COLOR_MENU_BUTTON
+_COL_BTN_HOVER = config.COLOR_MENU_BUTTON_HOVER
+_COL_BTN_ACTIVE = config.COLOR_MENU_BUTTON_ACTIVE
+_COL_BORDER = config.COLOR_MENU_BORDER
+_COL_TEXT = config.COLOR_TEXT
+_COL_TEXT_HL = config.COLOR_TEXT_HIGHLIGHT
+_COL_TEXT_DIM = config.COLOR_TEXT_DIM
+_COL_SELECTED = config.COLOR_SELECTED
+_COL_UI_BG = config.COLOR_UI_BG
+_FS_MED = config.FONT_SIZE_MEDIUM
+_FS_SMALL = config.FONT_SIZE_SMALL
+
+
+# Fonts are created lazily by _get_font(), possibly before the game's own
+# pygame.init() call (e.g. when a widget is built in a test or tool).
+# font.init() is safe to call more than once.
+pygame.font.init()
+
+
+@lru_cache(maxsize=32)
+def _get_font(size: int) -> pygame.font.Font:
+    """
+    Get the shared default font for a given size.
+
+    Creating a pygame.font.Font loads and parses the font file, which is far
+    too slow to do inside draw() 60 times per second. Fonts are created once
+    per size and shared by every widget.
+
+    Requires the font module to be initialized (done above at import).
+    """
+    return pygame.font.Font(None, size)
+
+
+def _to_display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """
+    Convert a rendered surface to the display's pixel format.
+
+    Surfaces in the display format blit much faster. Conversion needs a
+    display mode, so surfaces rendered before set_mode() are returned as-is.
+
+    Args:
+        surface: Surface to convert
+        alpha: Keep per-pixel transparency (text); False for opaque surfaces
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+@lru_cache(maxsize=512)
+def _render_text(text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Render text with the shared font of the given size (cached).
+
+    font.render() rasterizes every glyph, so each (text, size, color)
+    combination is rendered once and the same Surface is returned to every
+    widget that asks for it again. Callers must not draw onto the result.
+
+    Args:
+        text: The text to render
+        size: Font size
+        color: RGB color tuple (must be a tuple so it can be a cache key)
+    """
+    return _to_display_format(_get_font(size).render(text, True, color))
+
+
+def draw_batch(screen: pygame.Surface, widgets) -> None:
+    """
+    Draw a sequence of widgets onto the same surface, in order.
+
+    Menus draw their widgets in layers (labels, then dropdowns, then
+    buttons...), and each layer is just "draw every widget in this list".
+
+    Note: the screen is deliberately NOT locked around the batch. Locking
+    only helps direct pixel access - SDL refuses to blit to a locked
+    surface, and every widget here draws by blitting a cached surface.
+
+    Args:
+        screen: Surface to draw on (usually the main screen)
+        widgets: Iterable of objects with a draw(screen) method
+    """
+    for widget in widgets:
+        widget.draw(screen)
+
+
+def dirty_rects(widgets) -> List[pygame.Rect]:
+    """
+    Collect the screen areas of every widget that changed since it was drawn.
+
+    Screens that redraw only when something changed can pass these to
+    pygame.display.update(rects) instead of flipping the whole window.
+    Call this BEFORE drawing - draw() clears each widget's dirty flag.
+
+    Args:
+        widgets: Iterable of objects with is_dirty() and dirty_rect() methods
+
+    Returns:
+        List of Rects to update on the display
+    """
+    return [widget.dirty_rect() for widget in widgets if widget.is_dirty()]
+
+
 class Button:
     """
     Base button class with hover and click detection
@@ -33,6 +159,21 @@ class Button:
     - draw() is called every frame to render the button
     """
 
+    # __slots__ replaces the per-instance __dict__ with fixed attribute slots:
+    # less memory per widget and faster attribute access in update()/draw()
+    __slots__ = (
+        'rect', '_bbox', '_text', '_font_size', 'on_click',
+        'is_hovered', 'is_pressed', '_last_mouse_pos',
+        'color_normal', 'color_hover', 'color_active',
+        'color_border', 'color_text', 'color_text_hover',
+        '_bg_colors', '_border_widths', '_text_colors',
+        '_cached_text_key', '_cached_text_rect',
+        '_frames', 'image', 'dirty',
+    )
+
+    # Number of pre-rendered frames (one per draw state, see _build_state_tables)
+    _FRAME_COUNT = 4
+
     def __init__(
         self,
         x: int,
@@ -40,7 +181,7 @@ class Button:
         width: int,
         height: int,
         text: str,
-        font_size: int = config.FONT_SIZE_MEDIUM,
+        font_size: int = _FS_MED,
         on_click: Optional[Callable] = None
     ):
         """
@@ -59,21 +200,79 @@ class Button:
         # and easy positioning/centering
         self.rect = pygame.Rect(x, y, width, height)
 
-        self.text = text
-        self.font_size = font_size
+        # Plain-int bounds (left, top, right, bottom) for the per-frame hover
+        # test in update(); kept in sync with rect by set_position()
+        self._bbox = (x, y, x + width, y + height)
+
+        # Stored directly here; afterwards use the text/font_size properties,
+        # which discard the pre-rendered frames when the value changes
+        self._text = text
+        self._font_size = font_size
         self.on_click = on_click  # Store the callback function to call later
 
         # State flags (updated every frame)
         self.is_hovered = False  # Is mouse currently over this button?
         self.is_pressed = False  # Is button currently being clicked?
 
+        # Mouse position seen by the last update(); the hover state can only
+        # change when the mouse moves (or the button moves, see set_position)
+        self._last_mouse_pos = None
+
         # Colors for different button states (creates visual feedback)
-        self.color_normal = config.COLOR_MENU_BUTTON        # Default appearance
-        self.color_hover = config.COLOR_MENU_BUTTON_HOVER   # Mouse over button
-        self.color_active = config.COLOR_MENU_BUTTON_ACTIVE # Button being pressed
-        self.color_border = config.COLOR_MENU_BORDER
-        self.color_text = config.COLOR_TEXT
-        self.color_text_hover = config.COLOR_TEXT_HIGHLIGHT # Golden text when hovered
+        self.color_normal = _COL_BTN             # Default appearance
+        self.color_hover = _COL_BTN_HOVER        # Mouse over button
+        self.color_active = _COL_BTN_ACTIVE      # Button being pressed
+        self.color_border = _COL_BORDER
+        self.color_text = _COL_TEXT
+        self.color_text_hover = _COL_TEXT_HL     # Golden text when hovered
+
+        # Draw-state lookup tables, indexed by (is_pressed * 2 + is_hovered):
+        #   0 = idle, 1 = hovered, 2 = pressed but dragged off, 3 = pressed
+        # Built once so draw() is a table lookup instead of if/else ladders
+        self._build_state_tables()
+
+        # Text position inside the button, recomputed when the text or font
+        # size changes (the rendered text itself comes from _render_text)
+        self._cached_text_key = None
+        self._cached_text_rect = None
+
+        # Pre-rendered appearance: one complete frame (background + border +
+        # text) per draw state, built on first draw. draw() just blits the
+        # frame for the current state. Rebuilt if the text or font size change
+        self._frames = None
+
+        # Currently shown frame and whether it changed since the last draw
+        # (same image/dirty protocol as pygame's DirtySprite)
+        self.image = None
+        self.dirty = 1
+
+    @property
+    def text(self) -> str:
+        """Text displayed on the button."""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        if value != self._text:
+            self._text = value
+            self._invalidate_frames()
+
+    @property
+    def font_size(self) -> int:
+        """Size of the button text."""
+        return self._font_size
+
+    @font_size.setter
+    def font_size(self, value: int) -> None:
+        if value != self._font_size:
+            self._font_size = value
+            self._invalidate_frames()
+
+    def _invalidate_frames(self) -> None:
+        """Discard the pre-rendered frames so draw() rebuilds them."""
+        self._frames = None
+        self._cached_text_key = None
+        self.dirty = 1
 
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """
@@ -85,10 +284,20 @@ class Button:
             mouse_pos: Current (x, y) mouse coordinates from pygame.mouse.get_pos()
 
         This method checks if the mouse is inside the button's rectangle.
-        rect.collidepoint() is a Pygame built-in that returns True if the
-        point (mouse position) is inside the rectangle.
+        It is the same test as rect.collidepoint(mouse_pos), done with plain
+        integer comparisons so no call into Pygame is needed per button.
         """
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        # Mouse hasn't moved since last frame - hover state is unchanged
+        if mouse_pos == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = mouse_pos
+
+        mx, my = mouse_pos
+        left, top, right, bottom = self._bbox
+        is_hovered = left <= mx < right and top <= my < bottom
+        if is_hovered != self.is_hovered:
+            self.is_hovered = is_hovered
+            self.dirty = 1  # Appearance changed - show another frame
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -113,20 +322,27 @@ class Button:
         Returns:
             True if button was successfully clicked, False otherwise
         """
+        # Most events (keyboard, mouse motion, window) are not clicks:
+        # reject them with a single set lookup
+        # event.button: 1 = left click, 2 = middle click, 3 = right click
+        if event.type not in _DOWN_UP or event.button != 1:
+            return False
+
         # STEP 1: Detect mouse button press
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            # event.button: 1 = left click, 2 = middle click, 3 = right click
+        if event.type == pygame.MOUSEBUTTONDOWN:
             if self.is_hovered:
                 self.is_pressed = True  # Mark button as being pressed
+                self.dirty = 1
                 return False  # Not a complete click yet
 
         # STEP 2: Detect mouse button release
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+        else:
             # Only count as a click if:
             # 1. Mouse is still over the button (didn't drag away)
             # 2. Button was previously pressed down
             if self.is_hovered and self.is_pressed:
                 self.is_pressed = False
+                self.dirty = 1
 
                 # EXECUTE THE CALLBACK if one was provided
                 if self.on_click:
@@ -135,16 +351,97 @@ class Button:
                 return True  # Signal that a complete click occurred
 
             # Reset pressed state even if click was invalid
-            self.is_pressed = False
+            if self.is_pressed:
+                self.is_pressed = False
+                self.dirty = 1
 
         return False  # No click occurred
 
+    def set_position(self, x: int, y: int) -> None:
+        """
+        Move the button so its top-left corner is at (x, y).
+
+        The rect is moved in place, and the pre-rendered frames are drawn
+        relative to the button, so nothing needs to be re-rendered.
+
+        Args:
+            x, y: New top-left position
+        """
+        self.rect.topleft = (x, y)
+        self._bbox = (x, y, x + self.rect.width, y + self.rect.height)
+        self._last_mouse_pos = None  # Re-test hover on the next update()
+
+    def state_signature(self) -> tuple:
+        """
+        Small tuple describing everything that affects how the button looks.
+
+        If the signatures of all widgets on a screen are unchanged since
+        the last frame, the screen looks exactly the same and does not
+        need to be redrawn.
+        """
+        return (self.is_hovered, self.is_pressed)
+
+    def is_dirty(self) -> bool:
+        """True if the button's appearance changed since it was last drawn."""
+        return bool(self.dirty)
+
+    def dirty_rect(self) -> pygame.Rect:
+        """Screen area to update when the button is dirty (see dirty_rects)."""
+        return self.rect
+
     def draw(self, screen: pygame.Surface) -> None:
         """
         Draw the button to the screen
 
         CALLED EVERY FRAME (60 times per second) by the game loop
 
+        Every visual state is pre-rendered once (see _render_frame), so
+        drawing the button is a single blit of the frame for its state.
+
+        Args:
+            screen: The pygame Surface to draw on (usually the main screen)
+        """
+        # blit() = "Block Image Transfer" - draws one surface onto another
+        screen.blit(self._current_frame(), self.rect.topleft)
+
+    @classmethod
+    def draw_batch(cls, screen: pygame.Surface, buttons) -> None:
+        """
+        Draw many buttons with a single fblits() call.
+
+        Each button is already one pre-rendered surface (background, border
+        and text baked in), so a whole menu of buttons is just a list of
+        (surface, position) pairs. fblits() copies them all in one call
+        instead of one Python -> C round trip per button.
+
+        Args:
+            screen: The pygame Surface to draw on (usually the main screen)
+            buttons: Iterable of Button (or MenuButton) objects
+        """
+        screen.fblits([(button._current_frame(), button.rect.topleft) for button in buttons])
+
+    def _current_frame(self) -> pygame.Surface:
+        """
+        Get the pre-rendered frame for the button's current state.
+
+        Frames are rendered the first time they are needed (and again after
+        the text, size or colors change).
+
+        Returns:
+            Surface to blit at self.rect.topleft
+        """
+        if self._frames is None:
+            self._frames = tuple(self._render_frame(state) for state in range(self._FRAME_COUNT))
+
+        # Pick the visual state (see _build_state_tables)
+        self.image = self._frames[self.is_pressed * 2 + self.is_hovered]
+        self.dirty = 0
+        return self.image
+
+    def _render_frame(self, state: int) -> pygame.Surface:
+        """
+        Render the button's appearance for one draw state into a new surface.
+
         Drawing order matters! Later draws appear on top of earlier draws.
         We draw in layers:
         1. Filled background rectangle (button color)
@@ -152,37 +449,70 @@ class Button:
         3. Text centered on the button
 
         Args:
-            screen: The pygame Surface to draw on (usually the main screen)
+            state: Draw state index (see _build_state_tables)
+
+        Returns:
+            Surface the size of the button
         """
-        # LAYER 1: Determine background color based on current state
-        if self.is_pressed:
-            bg_color = self.color_active      # Brightest when pressed
-        elif self.is_hovered:
-            bg_color = self.color_hover       # Lighter when hovered
-        else:
-            bg_color = self.color_normal      # Normal when idle
+        surface = pygame.Surface(self.rect.size)
+        local_rect = surface.get_rect()  # Same size as self.rect, at (0, 0)
 
-        # Draw filled rectangle (the button background)
-        pygame.draw.rect(screen, bg_color, self.rect)
+        # LAYER 1: Draw filled rectangle (the button background)
+        # Brightest when pressed, lighter when hovered, normal when idle
+        pygame.draw.rect(surface, self._bg_colors[state], local_rect)
 
         # LAYER 2: Draw border (outline only, no fill)
         # The last parameter is border width (thicker when hovered for emphasis)
-        border_width = 3 if self.is_hovered else 2
-        pygame.draw.rect(screen, self.color_border, self.rect, border_width)
+        pygame.draw.rect(surface, self.color_border, local_rect, self._border_widths[state])
 
-        # LAYER 3: Render and draw text
-        # font.render() converts text string into a Surface (image)
-        font = pygame.font.Font(None, self.font_size)  # None = default font
-        text_color = self.color_text_hover if self.is_hovered else self.color_text
-        text_surface = font.render(self.text, True, text_color)
+        # LAYER 3: Draw text (rendered once per color, then reused)
+        text_surface = self._get_text_surface(self._text_colors[state])
 
-        # Center the text on the button
-        # get_rect() gets the text's bounding rectangle
-        # center= positions it at the button's center point
-        text_rect = text_surface.get_rect(center=self.rect.center)
+        # Text is centered on the button (see _get_text_surface)
+        surface.blit(text_surface, self._cached_text_rect)
 
-        # blit() = "Block Image Transfer" - draws one surface onto another
-        screen.blit(text_surface, text_rect)
+        return _to_display_format(surface, alpha=False)
+
+    def _build_state_tables(self) -> None:
+        """
+        Build the per-state color and border lookup tables used by draw().
+
+        Call again after changing any of the color_* attributes (this also
+        discards the pre-rendered frames).
+        """
+        #                  idle               hovered            pressed (off)      pressed
+        self._bg_colors = (self.color_normal, self.color_hover, self.color_active, self.color_active)
+        self._border_widths = (2, 3, 2, 3)
+        self._text_colors = (self.color_text, self.color_text_hover, self.color_text, self.color_text_hover)
+        self._frames = None
+        self.dirty = 1
+
+    def _get_text_surface(self, text_color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Get the rendered button text in the given color.
+
+        The text is rendered through the shared _render_text() cache. The
+        centered position of the text inside the button is cached alongside
+        in _cached_text_rect until the text or font size changes.
+
+        Args:
+            text_color: RGB color of the text
+
+        Returns:
+            Surface containing the rendered text
+        """
+        # font.render() converts text string into a Surface (image)
+        text_surface = _render_text(self.text, self.font_size, text_color)
+
+        key = (self.text, self.font_size)
+        if key != self._cached_text_key:
+            self._cached_text_key = key
+            # Center the text on the button (in button-local coordinates)
+            # get_rect() gets the text's bounding rectangle
+            # center= positions it at the button's center point
+            width, height = self.rect.size
+            self._cached_text_rect = text_surface.get_rect(center=(width // 2, height // 2))
+        return text_surface
 
 
 class MenuButton(Button):
@@ -198,6 +528,12 @@ class MenuButton(Button):
     (e.g., "Continue" button when there's no save file).
     """
 
+    __slots__ = ('enabled', 'color_disabled', 'color_text_disabled')
+
+    # One extra pre-rendered frame for the disabled appearance
+    _FRAME_COUNT = 5
+    _DISABLED_FRAME = 4
+
     def __init__(
         self,
         x: int,
@@ -225,7 +561,7 @@ class MenuButton(Button):
         """
         # Call the parent class (Button) constructor using super()
         # This sets up all the basic button functionality
-        super().__init__(x, y, width, height, text, config.FONT_SIZE_MEDIUM, on_click)
+        super().__init__(x, y, width, height, text, _FS_MED, on_click)
 
         # Add MenuButton-specific feature: enabled state
         self.enabled = enabled
@@ -234,6 +570,20 @@ class MenuButton(Button):
         self.color_disabled = (30, 30, 40)      # Very dark gray
         self.color_text_disabled = (80, 80, 90) # Dim text
 
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable the button.
+
+        Clears hover/press state when disabling. The disabled appearance
+        is one of the pre-rendered frames, so nothing is re-rendered.
+        """
+        self.enabled = enabled
+        if not enabled:
+            self.is_hovered = False
+            self.is_pressed = False
+        self._last_mouse_pos = None  # Re-test hover on the next update()
+        self.dirty = 1
+
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """
         Update only if button is enabled
@@ -257,25 +607,48 @@ class MenuButton(Button):
             return super().handle_event(event)  # Call Button's handle_event
         return False  # Disabled buttons don't respond to clicks
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def state_signature(self) -> tuple:
+        """Button signature plus the enabled flag (see Button.state_signature)."""
+        return (self.enabled, self.is_hovered, self.is_pressed)
+
+    def _current_frame(self) -> pygame.Surface:
         """
-        Draw with disabled state if not enabled
+        Pick the disabled frame if not enabled
 
-        OVERRIDES Button.draw() to add disabled appearance
+        OVERRIDES Button._current_frame() to add disabled appearance, so both
+        draw() and Button.draw_batch() show it.
         Disabled buttons are grayed out with dimmed text
         """
         if not self.enabled:
-            # Draw disabled appearance (no hover effects, dim colors)
-            pygame.draw.rect(screen, self.color_disabled, self.rect)
-            pygame.draw.rect(screen, self.color_border, self.rect, 1)
-
-            font = pygame.font.Font(None, self.font_size)
-            text_surface = font.render(self.text, True, self.color_text_disabled)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            screen.blit(text_surface, text_rect)
-        else:
-            # Enabled: use normal Button drawing logic
-            super().draw(screen)
+            # Disabled appearance (no hover effects, dim colors)
+            if self._frames is None:
+                self._frames = tuple(self._render_frame(state) for state in range(self._FRAME_COUNT))
+            self.image = self._frames[self._DISABLED_FRAME]
+            self.dirty = 0
+            return self.image
+
+        # Enabled: use normal Button frame selection
+        return super()._current_frame()
+
+    def _render_frame(self, state: int) -> pygame.Surface:
+        """
+        Render one frame; adds the disabled frame to Button's draw states.
+
+        The disabled appearance is a dark background, thin border and dim text.
+        """
+        if state != self._DISABLED_FRAME:
+            return super()._render_frame(state)
+
+        surface = pygame.Surface(self.rect.size)
+        local_rect = surface.get_rect()
+
+        pygame.draw.rect(surface, self.color_disabled, local_rect)
+        pygame.draw.rect(surface, self.color_border, local_rect, 1)
+
+        text_surface = self._get_text_surface(self.color_text_disabled)
+        surface.blit(text_surface, text_surface.get_rect(center=local_rect.center))
+
+        return _to_display_format(surface, alpha=False)
 
 
 class TextLabel:
@@ -286,13 +659,18 @@ class TextLabel:
     Useful for titles, subtitles, instructions, version numbers, etc.
     """
 
+    __slots__ = (
+        'x', 'y', 'text', 'font_size', 'color', 'center',
+        '_cached_text_surface', '_cached_text_rect', '_cached_text_key',
+    )
+
     def __init__(
         self,
         x: int,
         y: int,
         text: str,
-        font_size: int = config.FONT_SIZE_MEDIUM,
-        color: Tuple[int, int, int] = config.COLOR_TEXT,
+        font_size: int = _FS_MED,
+        color: Tuple[int, int, int] = _COL_TEXT,
         center: bool = False
     ):
         """
@@ -312,24 +690,52 @@ class TextLabel:
         self.color = color
         self.center = center
 
+        # Rendered text cache (re-rendered when text, size, color or position changes)
+        self._cached_text_surface = None
+        self._cached_text_rect = None
+        self._cached_text_key = None
+
     def draw(self, screen: pygame.Surface) -> None:
         """
         Draw the text label
 
         CALLED EVERY FRAME by the game loop
         """
-        font = pygame.font.Font(None, self.font_size)
-        text_surface = font.render(self.text, True, self.color)
+        key = (self.text, self.font_size, self.color, self.x, self.y, self.center)
+        if key != self._cached_text_key:
+            text_surface = _render_text(self.text, self.font_size, self.color)
 
-        # Position based on alignment mode
-        if self.center:
-            # (x, y) represents the center of the text
-            text_rect = text_surface.get_rect(center=(self.x, self.y))
-        else:
-            # (x, y) represents the top-left corner
-            text_rect = text_surface.get_rect(topleft=(self.x, self.y))
+            # Position based on alignment mode
+            if self.center:
+                # (x, y) represents the center of the text
+                self._cached_text_rect = text_surface.get_rect(center=(self.x, self.y))
+            else:
+                # (x, y) represents the top-left corner
+                self._cached_text_rect = text_surface.get_rect(topleft=(self.x, self.y))
+
+            self._cached_text_surface = text_surface
+            self._cached_text_key = key
+
+        # Skip labels that lie entirely outside the drawable area
+        if not screen.get_clip().colliderect(self._cached_text_rect):
+            return
+
+        screen.blit(self._cached_text_surface, self._cached_text_rect)
 
-        screen.blit(text_surface, text_rect)
+    def set_position(self, x: int, y: int) -> None:
+        """
+        Move the label (x, y is the center or top-left, as at creation).
+
+        Moves the cached text rect in place instead of re-rendering the text.
+        """
+        self.x = x
+        self.y = y
+        if self._cached_text_key is not None:
+            if self.center:
+                self._cached_text_rect.center = (x, y)
+            else:
+                self._cached_text_rect.topleft = (x, y)
+            self._cached_text_key = (self.text, self.font_size, self.color, x, y, self.center)
 
     def update_text(self, new_text: str) -> None:
         """
@@ -338,6 +744,197 @@ class TextLabel:
         Useful for dynamic labels (e.g., health counters, score displays)
         """
         self.text = new_text
+        self._cached_text_key = None  # Re-render on next draw
+
+
+class GlyphAtlas:
+    """
+    Every printable ASCII character of one font size and color, rendered
+    once into a single surface (a "texture atlas" / bitmap font).
+
+    Drawing a string is then just one blit per character from the atlas,
+    which is far cheaper than font.render() for text that changes often
+    (counters, timers...). Characters are placed side by side without
+    kerning, so spacing can differ very slightly from font.render().
+    """
+
+    __slots__ = ('surface', 'glyph_rects', 'height')
+
+    # Printable ASCII: space (32) through tilde (126)
+    CHARACTERS = "".join(chr(code) for code in range(32, 127))
+
+    def __init__(self, font_size: int, color: Tuple[int, int, int]):
+        """
+        Render the character set into the atlas.
+
+        Args:
+            font_size: Size of the font to rasterize
+            color: RGB color of the glyphs
+        """
+        font = _get_font(font_size)
+        glyphs = [font.render(char, True, color) for char in self.CHARACTERS]
+
+        # Pack glyphs left to right in one row
+        width = sum(glyph.get_width() for glyph in glyphs)
+        self.height = max(glyph.get_height() for glyph in glyphs)
+        surface = pygame.Surface((width, self.height), pygame.SRCALPHA)
+
+        self.glyph_rects = {}
+        x = 0
+        for char, glyph in zip(self.CHARACTERS, glyphs):
+            surface.blit(glyph, (x, 0))
+            self.glyph_rects[char] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+
+        self.surface = _to_display_format(surface)
+
+    def size(self, text: str) -> int:
+        """Width in pixels of text drawn with this atlas."""
+        glyph_rects = self.glyph_rects
+        unknown = glyph_rects["?"]
+        return sum(glyph_rects.get(char, unknown).width for char in text)
+
+    def draw_text(self, screen: pygame.Surface, pos: Tuple[int, int], text: str) -> None:
+        """
+        Draw text with its top-left corner at pos.
+
+        Characters outside the atlas are drawn as "?".
+        """
+        atlas = self.surface
+        glyph_rects = self.glyph_rects
+        unknown = glyph_rects["?"]
+        x, y = pos
+        blit_list = []
+        for char in text:
+            area = glyph_rects.get(char, unknown)
+            blit_list.append((atlas, (x, y), area))
+            x += area.width
+        # One call for the whole string instead of one blit() per character
+        screen.blits(blit_list, doreturn=False)
+
+
+@lru_cache(maxsize=16)
+def _get_glyph_atlas(font_size: int, color: Tuple[int, int, int]) -> GlyphAtlas:
+    """
+    Get the shared glyph atlas for a font size and color.
+
+    Built on first use (the font module must be initialized), then shared
+    by every label that uses the same size and color.
+    """
+    return GlyphAtlas(font_size, color)
+
+
+class BitmapTextLabel:
+    """
+    Text label drawn from a pre-rendered glyph atlas (see GlyphAtlas).
+
+    Same interface as TextLabel, but meant for text that changes very often
+    (health counters, timers): changing the text costs nothing, because no
+    font rendering happens after the atlas is built. For text that rarely
+    changes, TextLabel (which caches the whole rendered string) is cheaper.
+    """
+
+    __slots__ = ('x', 'y', 'text', 'font_size', 'color', 'center', '_width')
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        text: str,
+        font_size: int = _FS_MED,
+        color: Tuple[int, int, int] = _COL_TEXT,
+        center: bool = False
+    ):
+        """
+        Initialize a bitmap text label
+
+        Args:
+            x, y: Position (either top-left or center based on 'center' flag)
+            text: The text to display
+            font_size: Size of the text
+            color: RGB color tuple
+            center: If True, (x,y) is the center; if False, (x,y) is top-left
+        """
+        self.x = x
+        self.y = y
+        self.text = text
+        self.font_size = font_size
+        self.color = color
+        self.center = center
+        self._width = None  # Measured text width (only needed when centered)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw the label by blitting each character from the glyph atlas
+
+        CALLED EVERY FRAME by the game loop
+        """
+        atlas = _get_glyph_atlas(self.font_size, self.color)
+        x = self.x
+        y = self.y
+        if self.center:
+            if self._width is None:
+                self._width = atlas.size(self.text)
+            x -= self._width // 2
+            y -= atlas.height // 2
+        atlas.draw_text(screen, (x, y), self.text)
+
+    def update_text(self, new_text: str) -> None:
+        """Update the label text (no re-rendering needed)."""
+        self.text = new_text
+        self._width = None
+
+
+class RadioGroup:
+    """
+    A set of radio buttons where at most one is selected.
+
+    The group remembers which button is currently selected, so selecting
+    another one only has to clear that single button instead of looping
+    over the whole group.
+
+    Every button holds a reference to its group, so the group only holds
+    WEAK references back to its buttons. Otherwise the two would keep each
+    other alive after the screen that owns them is closed.
+    """
+
+    __slots__ = ('buttons', '_current_ref')
+
+    def __init__(self):
+        """Create an empty group (radio buttons add themselves to it)."""
+        self.buttons = weakref.WeakSet()
+        self._current_ref = None  # weakref to the selected RadioButton, if any
+
+    @property
+    def current(self) -> Optional["RadioButton"]:
+        """The selected RadioButton, or None."""
+        return self._current_ref() if self._current_ref is not None else None
+
+    def add(self, button: "RadioButton") -> None:
+        """
+        Add a radio button to the group.
+
+        If the button starts selected it becomes the group's current button.
+        """
+        self.buttons.add(button)
+        if button.selected:
+            self.select(button)
+
+    def select(self, button: "RadioButton") -> None:
+        """Make button the selected one, deselecting the previous selection."""
+        previous = self.current
+        if previous is not None and previous is not button:
+            previous.selected = False
+            previous.dirty = 1
+        self._current_ref = weakref.ref(button)
+        button.selected = True
+        button.dirty = 1
+
+    def __iter__(self):
+        return iter(self.buttons)
+
+    def __len__(self) -> int:
+        return len(self.buttons)
 
 
 class RadioButton:
@@ -349,13 +946,20 @@ class RadioButton:
     in the same group.
     """
 
+    # '__weakref__' lets RadioGroup hold weak references to the buttons
+    __slots__ = (
+        'x', 'y', 'text', 'value', 'selected', 'on_select', 'group',
+        'circle_radius', 'circle_center', 'rect', '_bbox', '_label_surfaces',
+        'is_hovered', '_last_mouse_pos', 'image', 'dirty', '__weakref__',
+    )
+
     def __init__(
         self,
         x: int,
         y: int,
         text: str,
-        value: any,
-        group: list,
+        value: Any,
+        group: RadioGroup,
         selected: bool = False,
         on_select: Optional[Callable] = None
     ):
@@ -366,7 +970,7 @@ class RadioButton:
             x, y: Position of the radio button
             text: Label text displayed next to the button
             value: The value this radio button represents
-            group: List that holds all radio buttons in this group
+            group: RadioGroup this button belongs to
             selected: Whether this button starts selected
             on_select: Callback function when this button is selected
         """
@@ -381,20 +985,45 @@ class RadioButton:
         self.circle_radius = 12
         self.circle_center = (x + self.circle_radius + 5, y + 20)
 
+        # Label text, pre-rendered in both colors (normal, hovered)
+        self._label_surfaces = (
+            _render_text(text, _FS_SMALL, _COL_TEXT),
+            _render_text(text, _FS_SMALL, _COL_TEXT_HL),
+        )
+
         # Clickable area (circle + text)
-        text_width = len(text) * 12  # Approximate text width
-        self.rect = pygame.Rect(x, y, text_width + 100, 40)
+        # Sized from the rendered label, so a click anywhere on the text
+        # registers; the label starts 2 radii + 20px right of x (see draw())
+        text_width, text_height = self._label_surfaces[0].get_size()
+        self.rect = pygame.Rect(
+            x, y, self.circle_radius * 2 + 20 + text_width, max(40, text_height + 10)
+        )
+        self._bbox = (x, y, self.rect.right, self.rect.bottom)  # For update()
 
         # Visual state
         self.is_hovered = False
+        self._last_mouse_pos = None  # Skip update() while the mouse is still
+
+        # Cached appearance (circle + label), re-rendered only when dirty
+        self.image = None
+        self.dirty = 1
 
         # Add self to group
-        group.append(self)
         self.group = group
+        group.add(self)
 
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """Update hover state based on mouse position."""
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        if mouse_pos == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = mouse_pos
+
+        mx, my = mouse_pos
+        left, top, right, bottom = self._bbox
+        is_hovered = left <= mx < right and top <= my < bottom
+        if is_hovered != self.is_hovered:
+            self.is_hovered = is_hovered
+            self.dirty = 1
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -403,49 +1032,79 @@ class RadioButton:
         When clicked, deselect all other radio buttons in the group
         and select this one.
         """
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.is_hovered:
-                # Deselect all buttons in group
-                for button in self.group:
-                    button.selected = False
+        # Only left-button presses matter; reject everything else up front
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return False
 
-                # Select this button
-                self.selected = True
+        if self.is_hovered:
+            # Select this button (the group deselects the previous one)
+            self.group.select(self)
 
-                # Call callback if provided
-                if self.on_select:
-                    self.on_select(self.value)
+            # Call callback if provided
+            if self.on_select:
+                self.on_select(self.value)
 
-                return True
+            return True
         return False
 
+    def set_position(self, x: int, y: int) -> None:
+        """Move the radio button so its top-left corner is at (x, y)."""
+        self.x = x
+        self.y = y
+        self.circle_center = (x + self.circle_radius + 5, y + 20)
+        self.rect.topleft = (x, y)
+        self._bbox = (x, y, self.rect.right, self.rect.bottom)
+        self._last_mouse_pos = None
+
+    def state_signature(self) -> tuple:
+        """Everything that affects how the radio button looks (see Button.state_signature)."""
+        return (self.is_hovered, self.selected)
+
+    def is_dirty(self) -> bool:
+        """True if the radio button's appearance changed since it was last drawn."""
+        return bool(self.dirty)
+
+    def dirty_rect(self) -> pygame.Rect:
+        """Screen area to update when the radio button is dirty (see dirty_rects)."""
+        return self.rect
+
     def draw(self, screen: pygame.Surface) -> None:
         """
         Draw the radio button.
 
         Shows a circle (filled if selected, empty if not) and label text.
+        The appearance is cached in self.image and re-rendered only when
+        the hover or selected state changes.
         """
+        if self.dirty:
+            self.image = self._render_image()
+            self.dirty = 0
+        screen.blit(self.image, self.rect.topleft)
+
+    def _render_image(self) -> pygame.Surface:
+        """Render the circle and label into a transparent surface the size of self.rect."""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+
         # Determine colors based on state
-        if self.is_hovered:
-            circle_color = config.COLOR_TEXT_HIGHLIGHT
-            text_color = config.COLOR_TEXT_HIGHLIGHT
-        else:
-            circle_color = config.COLOR_MENU_BORDER
-            text_color = config.COLOR_TEXT
+        circle_color = _COL_TEXT_HL if self.is_hovered else _COL_BORDER
+
+        # Circle center relative to the button's top-left corner
+        center = (self.circle_center[0] - self.x, self.circle_center[1] - self.y)
 
         # Draw outer circle
-        pygame.draw.circle(screen, circle_color, self.circle_center, self.circle_radius, 2)
+        pygame.draw.circle(surface, circle_color, center, self.circle_radius, 2)
 
         # Draw filled inner circle if selected
         if self.selected:
-            pygame.draw.circle(screen, circle_color, self.circle_center, self.circle_radius - 4)
+            pygame.draw.circle(surface, circle_color, center, self.circle_radius - 4)
+
+        # Draw label text (pre-rendered in __init__)
+        text_surface = self._label_surfaces[self.is_hovered]
+        text_x = center[0] + self.circle_radius + 15
+        text_y = center[1] - (_FS_SMALL // 2)
+        surface.blit(text_surface, (text_x, text_y))
 
-        # Draw label text
-        font = pygame.font.Font(None, config.FONT_SIZE_SMALL)
-        text_surface = font.render(self.text, True, text_color)
-        text_x = self.circle_center[0] + self.circle_radius + 15
-        text_y = self.circle_center[1] - (config.FONT_SIZE_SMALL // 2)
-        screen.blit(text_surface, (text_x, text_y))
+        return _to_display_format(surface)
 
 
 class Separator:
@@ -456,6 +1115,8 @@ class Separator:
     of UI elements.
     """
 
+    __slots__ = ('x', 'y', 'width', 'thickness', 'color', '_rect', '_surface')
+
     def __init__(
         self,
         x: int,
@@ -477,7 +1138,23 @@ class Separator:
         self.y = y
         self.width = width
         self.thickness = thickness
-        self.color = color if color else config.COLOR_MENU_BORDER
+        self.color = color if color else _COL_BORDER
+
+        # Area covered by the line: draw.line() puts the extra row of an
+        # even-thickness line below y, so the top is y - (thickness - 1) // 2
+        self._rect = pygame.Rect(x, y - (thickness - 1) // 2, width + 1, thickness)
+
+        # The line never changes, so it is a solid strip filled once here;
+        # drawing it is then a plain blit instead of draw.line() every frame
+        surface = pygame.Surface(self._rect.size)
+        surface.fill(self.color)
+        self._surface = _to_display_format(surface, alpha=False)
+
+    def set_position(self, x: int, y: int) -> None:
+        """Move the separator so it starts at (x, y)."""
+        self.x = x
+        self.y = y
+        self._rect.topleft = (x, y - (self.thickness - 1) // 2)
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -485,13 +1162,11 @@ class Separator:
 
         CALLED EVERY FRAME by the game loop.
         """
-        pygame.draw.line(
-            screen,
-            self.color,
-            (self.x, self.y),
-            (self.x + self.width, self.y),
-            self.thickness
-        )
+        # Skip separators that lie entirely outside the drawable area
+        if not screen.get_clip().colliderect(self._rect):
+            return
+
+        screen.blit(self._surface, self._rect.topleft)
 
 
 class Dropdown:
@@ -502,6 +1177,14 @@ class Dropdown:
     and collapses after selection.
     """
 
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'options', 'selected_index', 'on_select',
+        'is_expanded', 'is_hovered', 'hovered_option', '_last_mouse_pos',
+        'main_rect', '_main_bbox', '_arrow_up', '_arrow_down',
+        'option_rects', '_expanded_rect', '_expanded_bbox', '_option_text_rects',
+        '_cached_text_surfaces', '_cached_text_key', 'image', 'dirty',
+    )
+
     def __init__(
         self,
         x: int,
@@ -533,37 +1216,100 @@ class Dropdown:
         self.is_expanded = False
         self.is_hovered = False
         self.hovered_option = -1  # Which option in dropdown is hovered
+        self._last_mouse_pos = None  # Skip update() while nothing can change
 
         # Main button rect (always visible)
         self.main_rect = pygame.Rect(x, y, width, self.height)
+        self._main_bbox = (x, y, x + width, y + self.height)  # For update()
+
+        # Arrow polygons, built once (relative to the main button's top-left)
+        arrow_x = width - 30
+        arrow_y = self.height // 2
+        self._arrow_up = ((arrow_x, arrow_y - 5), (arrow_x - 8, arrow_y + 5), (arrow_x + 8, arrow_y + 5))
+        self._arrow_down = ((arrow_x, arrow_y + 5), (arrow_x - 8, arrow_y - 5), (arrow_x + 8, arrow_y - 5))
 
         # Option rects (only when expanded)
-        self.option_rects = []
+        self.option_rects = ()
         self._update_option_rects()
 
+        # Rendered option text cache (one surface per option, same order)
+        self._cached_text_surfaces = []
+        self._cached_text_key = None
+        self._option_text_rects = None  # Text position inside each option rect
+
+        # Cached appearance of the main button, re-rendered only when dirty
+        # (hover, expansion, selection or hovered option changed)
+        self.image = None
+        self.dirty = 1
+
     def _update_option_rects(self) -> None:
         """Update the rectangles for each dropdown option."""
-        self.option_rects = []
-        for i in range(len(self.options)):
-            rect = pygame.Rect(
-                self.x,
-                self.y + self.height + (i * self.height),
-                self.width,
-                self.height
-            )
-            self.option_rects.append(rect)
+        # Options are stacked directly below the main button, one row each.
+        # Stored as a tuple: built in one go and never resized afterwards
+        x, width, height = self.x, self.width, self.height
+        base_y = self.y + height
+        self.option_rects = tuple(
+            pygame.Rect(x, base_y + i * height, width, height)
+            for i in range(len(self.options))
+        )
+        self._option_text_rects = None  # Recomputed on next draw
+
+        # Bounding box of the whole option list (used to skip per-option tests)
+        self._expanded_rect = pygame.Rect(
+            self.x,
+            self.y + self.height,
+            self.width,
+            self.height * len(self.options)
+        )
+        self._expanded_bbox = (
+            self._expanded_rect.left, self._expanded_rect.top,
+            self._expanded_rect.right, self._expanded_rect.bottom
+        )
+
+    def _get_option_surfaces(self) -> List[pygame.Surface]:
+        """
+        Get the rendered text for every option (cached).
+
+        Option labels rarely change, so they are rendered once and only
+        re-rendered if the option texts are replaced.
+        """
+        key = tuple(text for text, _ in self.options)
+        if key != self._cached_text_key:
+            self._cached_text_surfaces = [
+                _render_text(text, _FS_MED, _COL_TEXT)
+                for text in key
+            ]
+            self._cached_text_key = key
+            self._option_text_rects = None
+        return self._cached_text_surfaces
 
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """Update hover states."""
-        self.is_hovered = self.main_rect.collidepoint(mouse_pos)
+        # Hover states only change when the mouse moves or the dropdown
+        # opens/closes (handle_event and set_position reset _last_mouse_pos)
+        if mouse_pos == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = mouse_pos
+
+        mx, my = mouse_pos
+        left, top, right, bottom = self._main_bbox
+        is_hovered = left <= mx < right and top <= my < bottom
+        if is_hovered != self.is_hovered:
+            self.is_hovered = is_hovered
+            self.dirty = 1
 
         # Check which option is hovered (if expanded)
-        self.hovered_option = -1
+        # Options are stacked rows of equal height, so once the mouse is
+        # inside the option list the row index follows directly from its
+        # y offset - no need to test every option rect
+        hovered_option = -1
         if self.is_expanded:
-            for i, rect in enumerate(self.option_rects):
-                if rect.collidepoint(mouse_pos):
-                    self.hovered_option = i
-                    break
+            left, top, right, bottom = self._expanded_bbox
+            if left <= mx < right and top <= my < bottom:
+                hovered_option = (my - top) // self.height
+        if hovered_option != self.hovered_option:
+            self.hovered_option = hovered_option
+            self.dirty = 1
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -572,30 +1318,80 @@ class Dropdown:
         Click on main button toggles expansion.
         Click on option selects it and collapses.
         """
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            # Click on main button
-            if self.is_hovered and not self.is_expanded:
-                self.is_expanded = True
-                return True
+        # Only left-button presses matter; reject everything else up front
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return False
 
-            # Click on an option
-            if self.is_expanded and self.hovered_option != -1:
-                self.selected_index = self.hovered_option
-                self.is_expanded = False
+        # Click on main button
+        if self.is_hovered and not self.is_expanded:
+            self.is_expanded = True
+            self._last_mouse_pos = None
+            self.dirty = 1
+            return True
+
+        # Click on an option
+        if self.is_expanded and self.hovered_option != -1:
+            self.selected_index = self.hovered_option
+            self.is_expanded = False
+            self.hovered_option = -1
+            self._last_mouse_pos = None
+            self.dirty = 1
+
+            # Call callback with selected value
+            if self.on_select:
+                _, value = self.options[self.selected_index]
+                self.on_select(value)
+
+            return True
+
+        # Click outside dropdown when expanded - collapse it
+        if self.is_expanded:
+            self.is_expanded = False
+            self._last_mouse_pos = None
+            self.dirty = 1
+            return True
 
-                # Call callback with selected value
-                if self.on_select:
-                    _, value = self.options[self.selected_index]
-                    self.on_select(value)
+        return False
 
-                return True
+    def set_position(self, x: int, y: int) -> None:
+        """
+        Move the dropdown so its top-left corner is at (x, y).
 
-            # Click outside dropdown when expanded - collapse it
-            if self.is_expanded:
-                self.is_expanded = False
-                return True
+        All rects are shifted in place by the offset, so no Rects are
+        rebuilt and the cached image and option text stay valid.
+        """
+        dx = x - self.x
+        dy = y - self.y
+        self.x = x
+        self.y = y
+        self.main_rect.move_ip(dx, dy)
+        self._main_bbox = (x, y, x + self.width, y + self.height)
+        self._last_mouse_pos = None
+        self._expanded_rect.move_ip(dx, dy)
+        left, top, right, bottom = self._expanded_bbox
+        self._expanded_bbox = (left + dx, top + dy, right + dx, bottom + dy)
+        for rect in self.option_rects:
+            rect.move_ip(dx, dy)
+        if self._option_text_rects is not None:
+            for rect in self._option_text_rects:
+                rect.move_ip(dx, dy)
 
-        return False
+    def state_signature(self) -> tuple:
+        """Everything that affects how the dropdown looks (see Button.state_signature)."""
+        return (self.is_hovered, self.is_expanded, self.hovered_option, self.selected_index)
+
+    def is_dirty(self) -> bool:
+        """True if the dropdown's appearance changed since it was last drawn."""
+        return bool(self.dirty)
+
+    def dirty_rect(self) -> pygame.Rect:
+        """
+        Screen area to update when the dropdown is dirty (see dirty_rects).
+
+        Always includes the option list: it appears when the dropdown opens
+        and whatever was underneath has to reappear when it closes.
+        """
+        return self.main_rect.union(self._expanded_rect)
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -604,48 +1400,161 @@ class Dropdown:
         Shows the main button with current selection.
         If expanded, shows all options below.
         """
-        # Draw main button
-        bg_color = config.COLOR_MENU_BUTTON_HOVER if self.is_hovered else config.COLOR_MENU_BUTTON
-        pygame.draw.rect(screen, bg_color, self.main_rect)
-        pygame.draw.rect(screen, config.COLOR_MENU_BORDER, self.main_rect, 2)
-
-        # Draw current selection text
-        font = pygame.font.Font(None, config.FONT_SIZE_MEDIUM)
-        selected_text, _ = self.options[self.selected_index]
-        text_surface = font.render(selected_text, True, config.COLOR_TEXT)
-        text_rect = text_surface.get_rect(center=self.main_rect.center)
-        screen.blit(text_surface, text_rect)
-
-        # Draw dropdown arrow
-        arrow_x = self.x + self.width - 30
-        arrow_y = self.y + self.height // 2
-        if self.is_expanded:
-            # Up arrow
-            points = [(arrow_x, arrow_y + 5), (arrow_x - 8, arrow_y - 5), (arrow_x + 8, arrow_y - 5)]
-        else:
-            # Down arrow
-            points = [(arrow_x, arrow_y + 5), (arrow_x - 8, arrow_y - 5), (arrow_x + 8, arrow_y - 5)]
-            points = [(arrow_x, arrow_y - 5), (arrow_x - 8, arrow_y + 5), (arrow_x + 8, arrow_y + 5)]
-        pygame.draw.polygon(screen, config.COLOR_TEXT, points)
+        # Draw main button (cached, re-rendered only when dirty)
+        if self.dirty:
+            self.image = self._render_image()
+            self.dirty = 0
+        screen.blit(self.image, self.main_rect.topleft)
 
         # Draw options if expanded
         if self.is_expanded:
-            for i, (option_text, _) in enumerate(self.options):
-                rect = self.option_rects[i]
-
+            option_surfaces = self._get_option_surfaces()
+            if self._option_text_rects is None:
+                self._option_text_rects = [
+                    text_surface.get_rect(center=rect.center)
+                    for text_surface, rect in zip(option_surfaces, self.option_rects)
+                ]
+            for i, rect in enumerate(self.option_rects):
                 # Background color (highlight if hovered)
                 if i == self.hovered_option:
-                    bg_color = config.COLOR_MENU_BUTTON_HOVER
+                    bg_color = _COL_BTN_HOVER
                 else:
-                    bg_color = config.COLOR_MENU_BUTTON
+                    bg_color = _COL_BTN
 
                 pygame.draw.rect(screen, bg_color, rect)
-                pygame.draw.rect(screen, config.COLOR_MENU_BORDER, rect, 2)
+                pygame.draw.rect(screen, _COL_BORDER, rect, 2)
 
                 # Option text
-                text_surface = font.render(option_text, True, config.COLOR_TEXT)
-                text_rect = text_surface.get_rect(center=rect.center)
-                screen.blit(text_surface, text_rect)
+                screen.blit(option_surfaces[i], self._option_text_rects[i])
+
+    def _render_image(self) -> pygame.Surface:
+        """Render the main button (current selection + arrow) into a surface the size of main_rect."""
+        surface = pygame.Surface(self.main_rect.size)
+        local_rect = surface.get_rect()
+
+        bg_color = _COL_BTN_HOVER if self.is_hovered else _COL_BTN
+        pygame.draw.rect(surface, bg_color, local_rect)
+        pygame.draw.rect(surface, _COL_BORDER, local_rect, 2)
+
+        # Draw current selection text
+        option_surfaces = self._get_option_surfaces()
+        text_surface = option_surfaces[self.selected_index]
+        text_rect = text_surface.get_rect(center=local_rect.center)
+        surface.blit(text_surface, text_rect)
+
+        # Draw dropdown arrow (points up while the list is open, down otherwise)
+        points = self._arrow_up if self.is_expanded else self._arrow_down
+        pygame.draw.polygon(surface, _COL_TEXT, points)
+
+        return _to_display_format(surface, alpha=False)
+
+
+@lru_cache(maxsize=64)
+def _split_name(full_name: str) -> Tuple[str, str]:
+    """
+    Split an investigator name over two lines for the tile (cached).
+
+    Line 1: First name + nickname (if present)
+    Line 2: Last name
+
+    Format can be "First Last" or "First 'Nick' Last".
+    A name is only split once, even if tiles are rebuilt (e.g. after a
+    rename), since the result for a given name never changes.
+
+    Returns:
+        (first_line, second_line) - second_line is "" for single-word names
+    """
+    name_parts = full_name.split()
+
+    # Check if there's a nickname (indicated by quotes)
+    has_nickname = any("'" in part for part in name_parts)
+
+    if has_nickname:
+        # Find the last name (everything after the closing quote)
+        # Example: "Arthur 'Bones' Blackwood" -> ["Arthur", "'Bones'", "Blackwood"]
+        quote_end_idx = None
+        for i, part in enumerate(name_parts):
+            if part.endswith("'"):
+                quote_end_idx = i
+                break
+
+        if quote_end_idx is not None and quote_end_idx + 1 < len(name_parts):
+            # Line 1: First name + nickname
+            first_line = " ".join(name_parts[:quote_end_idx + 1])
+            # Line 2: Last name (everything after nickname)
+            second_line = " ".join(name_parts[quote_end_idx + 1:])
+        else:
+            # Fallback: just split in half
+            mid = len(name_parts) // 2
+            first_line = " ".join(name_parts[:mid])
+            second_line = " ".join(name_parts[mid:])
+    else:
+        # No nickname: "First Last" or "First Middle Last"
+        if len(name_parts) >= 2:
+            # First name on line 1, last name on line 2
+            first_line = " ".join(name_parts[:-1])  # Everything except last word
+            second_line = name_parts[-1]  # Last word
+        else:
+            # Single word name (shouldn't happen, but handle it)
+            first_line = full_name
+            second_line = ""
+
+    return first_line, second_line
+
+
+def _prebaked_portrait_path(path: str, size: int) -> Path:
+    """
+    Get where the pre-scaled copy of a portrait is stored on disk.
+
+    The source folder name is kept (male/female both have an "athlete.png"),
+    e.g. assets/images/investigators/male/athlete.png at 170px becomes
+    <PORTRAIT_CACHE_DIR>/male/athlete@170.png
+
+    Args:
+        path: Source image file path
+        size: Width and height of the scaled portrait
+    """
+    source = Path(path)
+    return Path(config.PORTRAIT_CACHE_DIR) / source.parent.name / f"{source.stem}@{size}.png"
+
+
+@lru_cache(maxsize=64)
+def _load_portrait(path: str, size: int) -> pygame.Surface:
+    """
+    Load a portrait image scaled to a size x size square (cached).
+
+    Decoding and scaling an image is slow, so every (path, size) pair is
+    done once and the same Surface is shared by every tile that shows it.
+    The image is converted to the display's pixel format (with alpha) so
+    blitting it is a plain copy.
+
+    A pre-scaled copy on disk (see _prebaked_portrait_path) is loaded
+    directly when it is at least as new as the source. Otherwise the source
+    is scaled here and the result written to disk for the next launch.
+
+    Args:
+        path: Image file path
+        size: Width and height of the scaled portrait
+    """
+    prebaked = _prebaked_portrait_path(path, size)
+    try:
+        if prebaked.stat().st_mtime >= Path(path).stat().st_mtime:
+            return _to_display_format(pygame.image.load(str(prebaked)))
+    except (OSError, pygame.error):
+        pass  # Not baked yet (or unreadable) - scale the source below
+
+    image = _to_display_format(pygame.image.load(path))
+    image = pygame.transform.smoothscale(image, (size, size))
+
+    # Write-through, so the next launch skips the scaling. A read-only
+    # install just keeps scaling at startup.
+    try:
+        prebaked.parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(image, str(prebaked))
+    except (OSError, pygame.error):
+        pass
+
+    return image
 
 
 class InvestigatorTile:
@@ -663,6 +1572,16 @@ class InvestigatorTile:
     Clickable to select the investigator.
     """
 
+    __slots__ = (
+        'rect', '_bbox', 'investigator', 'on_click', 'is_hovered', 'is_selected',
+        '_last_mouse_pos', 'portrait_rect', 'portrait_image', 'stats_x', 'stats_y',
+        'bar_width', 'bar_height', '_name_surfaces', '_name_surfaces_dim',
+        '_symbol_surface', '_symbol_pos', '_styles', '_panel_surface', '_panel_key',
+        '_bar_bg', '_fill_rect', '_portrait_local', '_text_x', '_name_y',
+        '_bar_h13', '_hp_y', '_san_y', '_stats_y', '_move_x', '_will_x',
+        '_cached_name', '_last_stat_values', '_stat_blits', '_pos', '_portrait_pos',
+    )
+
     def __init__(
         self,
         x: int,
@@ -683,12 +1602,14 @@ class InvestigatorTile:
             on_click: Callback when tile is clicked
         """
         self.rect = pygame.Rect(x, y, width, height)
+        self._bbox = (x, y, x + width, y + height)  # Plain-int bounds for update()
         self.investigator = investigator
         self.on_click = on_click
 
         # Visual state
         self.is_hovered = False
         self.is_selected = False
+        self._last_mouse_pos = None  # Skip update() while the mouse is still
 
         # Portrait area (left side of tile)
         portrait_size = min(width // 3, height - 10)
@@ -707,12 +1628,8 @@ class InvestigatorTile:
                 from pathlib import Path
                 image_path = Path(investigator.image_path)
                 if image_path.exists():
-                    self.portrait_image = pygame.image.load(str(image_path))
-                    # Scale to fit portrait area
-                    self.portrait_image = pygame.transform.scale(
-                        self.portrait_image,
-                        (portrait_size, portrait_size)
-                    )
+                    # Load and scale to fit portrait area (shared between tiles)
+                    self.portrait_image = _load_portrait(str(image_path), portrait_size)
             except Exception as e:
                 print(f"Failed to load portrait for {investigator.name}: {e}")
                 self.portrait_image = None
@@ -725,9 +1642,115 @@ class InvestigatorTile:
         self.bar_width = width - portrait_size - 25
         self.bar_height = 12
 
+        # Layout inside the tile, relative to its top-left corner (the tile
+        # is rendered into its own surface, see _render_panel). The layout
+        # never changes, so all offsets are worked out once here
+        self._pos = (x, y)  # Blit position of the tile
+        self._portrait_local = self.portrait_rect.move(-x, -y)
+        self._portrait_pos = self._portrait_local.topleft
+        self._text_x = self.stats_x - x
+        self._name_y = self.stats_y - y
+        self._bar_h13 = int(self.bar_height * 1.3)  # Slightly taller bars
+        # Health bar below the two-line name (was 50 before names wrapped)
+        self._hp_y = self._name_y + 70
+        self._san_y = self._hp_y + self._bar_h13 + 12  # More spacing (was 8)
+        self._stats_y = self._san_y + self._bar_h13 + 18  # More spacing (was 12)
+        self._move_x = self._text_x + 105  # Increased from 75
+        self._will_x = self._text_x + 200  # Increased from 140
+
+        # Name lines: split and rendered once here (and again only if the
+        # investigator is renamed, see _render_panel)
+        self._cached_name = None
+        self._render_name()
+
+        # Stat line (ACC / MOV / WIL) surfaces, rebuilt only when the values
+        # change (see _render_panel)
+        self._last_stat_values = None
+        self._stat_blits = []
+
+        # Fallback symbol (drawn when there is no portrait), centered once
+        self._symbol_surface = None
+        self._symbol_pos = None
+        if self.portrait_image is None:
+            self._symbol_surface = _render_text(investigator.symbol, 48, config.COLOR_PLAYER)
+            # Tile-relative, like the rest of the layout
+            self._symbol_pos = self._symbol_surface.get_rect(center=self._portrait_local.center).topleft
+
+        # Background and border style for every combination of state flags,
+        # indexed by (is_incapacitated * 4 + is_selected * 2 + is_hovered)
+        # so draw() does a single lookup instead of two if/elif chains
+        self._styles = []
+        for state in range(8):
+            incapacitated, selected, hovered = state & 4, state & 2, state & 1
+
+            # Background color (darker if incapacitated)
+            if incapacitated:
+                bg_color = (20, 20, 25)
+            elif hovered:
+                bg_color = _COL_BTN_HOVER
+            else:
+                bg_color = _COL_UI_BG
+
+            # Border (yellow if selected, red if incapacitated, normal otherwise)
+            if selected:
+                border_color, border_width = _COL_SELECTED, 4
+            elif incapacitated:
+                border_color, border_width = (100, 30, 30), 2  # Dark red
+            else:
+                border_color, border_width = _COL_BORDER, 2
+
+            self._styles.append((bg_color, border_color, border_width))
+        self._styles = tuple(self._styles)
+
+        # Cached rendering of the whole tile (see draw())
+        self._panel_surface = None
+        self._panel_key = None
+
+        # Empty resource bar (background + border), the same for every bar,
+        # so it is drawn once here and _draw_resource_bar just blits it
+        bar_bg = pygame.Surface((self.bar_width, self._bar_h13))
+        bar_bg.fill((40, 40, 50))
+        pygame.draw.rect(bar_bg, (80, 80, 90), bar_bg.get_rect(), 1)
+        self._bar_bg = _to_display_format(bar_bg, alpha=False)
+
+        # Rect reused by _draw_resource_bar (moved in place for each bar)
+        self._fill_rect = pygame.Rect(0, 0, 0, 0)
+
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """Update hover state based on mouse position."""
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        if mouse_pos == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = mouse_pos
+
+        # Same test as rect.collidepoint(), without the call into Pygame
+        mx, my = mouse_pos
+        left, top, right, bottom = self._bbox
+        self.is_hovered = left <= mx < right and top <= my < bottom
+
+    @classmethod
+    def update_all(cls, tiles, mouse_pos: Tuple[int, int]) -> None:
+        """
+        Update the hover state of a whole panel of tiles in one pass.
+
+        Tiles never overlap, so at most one can be hovered: the search stops
+        at the first hit and every other tile is simply not hovered. This
+        replaces one update() call per tile.
+
+        Args:
+            tiles: List of InvestigatorTile objects (e.g. the battle panel)
+            mouse_pos: Current mouse position
+        """
+        mx, my = mouse_pos
+        hovered = None
+        for tile in tiles:
+            left, top, right, bottom = tile._bbox
+            if left <= mx < right and top <= my < bottom:
+                hovered = tile
+                break
+
+        for tile in tiles:
+            tile.is_hovered = tile is hovered
+            tile._last_mouse_pos = mouse_pos
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -736,133 +1759,141 @@ class InvestigatorTile:
         Returns:
             True if tile was clicked, False otherwise
         """
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.is_hovered:
-                # Execute callback if provided
-                if self.on_click:
-                    self.on_click(self.investigator)
-                return True
+        # Only left-button presses matter; reject everything else up front
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return False
+
+        if self.is_hovered:
+            # Execute callback if provided
+            if self.on_click:
+                self.on_click(self.investigator)
+            return True
         return False
 
     def set_selected(self, selected: bool) -> None:
         """Set the selection state of this tile."""
         self.is_selected = selected
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
         """
         Draw the investigator tile.
 
         Shows portrait, name, health/sanity bars, and stats.
+        The tile is rendered into a cached surface, which is only redrawn
+        when something it shows changes (see _panel_state); between player
+        actions drawing the tile is a single blit.
+
+        Returns:
+            The tile's rect if its appearance changed this frame, else None
+            (for pygame.display.update(rects) in loops that track changes)
+        """
+        changed = None
+        key = self._panel_state()
+        if key != self._panel_key:
+            if self._panel_surface is None:
+                self._panel_surface = _to_display_format(pygame.Surface(self.rect.size), alpha=False)
+            self._render_panel(self._panel_surface)
+            self._panel_key = key
+            changed = self.rect
+
+        screen.blit(self._panel_surface, self._pos)
+        return changed
+
+    def _panel_state(self) -> tuple:
+        """Everything shown on the tile; the cached surface is redrawn when this changes."""
+        investigator = self.investigator
+        return (
+            investigator.current_health, investigator.max_health,
+            investigator.current_sanity, investigator.max_sanity,
+            investigator.accuracy, investigator.movement_range, investigator.will,
+            investigator.is_incapacitated, investigator.name,
+            self.is_hovered, self.is_selected,
+        )
+
+    def _render_name(self) -> None:
         """
-        # Background color (darker if incapacitated)
-        if self.investigator.is_incapacitated:
-            bg_color = (20, 20, 25)
-        elif self.is_hovered:
-            bg_color = config.COLOR_MENU_BUTTON_HOVER
-        else:
-            bg_color = config.COLOR_UI_BG
+        Split the investigator's name over two lines and render both lines.
+
+        One surface pair per color (normal / incapacitated).
+        """
+        name = self.investigator.name
+        name_size = 38  # Slightly smaller to fit 2 lines
+        first_line, second_line = _split_name(name)
+        self._name_surfaces = (
+            _render_text(first_line, name_size, _COL_TEXT),
+            _render_text(second_line, name_size, _COL_TEXT) if second_line else None,
+        )
+        self._name_surfaces_dim = (
+            _render_text(first_line, name_size, _COL_TEXT_DIM),
+            _render_text(second_line, name_size, _COL_TEXT_DIM) if second_line else None,
+        )
+        self._cached_name = name
+
+    def _render_panel(self, surface: pygame.Surface) -> None:
+        """
+        Draw the whole tile onto a surface the size of the tile.
+
+        Args:
+            surface: Panel surface (coordinates relative to the tile's top-left)
+        """
+        local_rect = surface.get_rect()
+        portrait_rect = self._portrait_local
+        stats_x = self._text_x
+        name_y = self._name_y
+        bar_height = self._bar_h13
+
+        # Look up background and border style (see __init__)
+        state = self.investigator.is_incapacitated * 4 + self.is_selected * 2 + self.is_hovered
+        bg_color, border_color, border_width = self._styles[state]
 
         # Draw background
-        pygame.draw.rect(screen, bg_color, self.rect)
+        pygame.draw.rect(surface, bg_color, local_rect)
 
         # Draw border (yellow if selected, red if incapacitated, normal otherwise)
-        if self.is_selected:
-            border_color = config.COLOR_SELECTED
-            border_width = 4
-        elif self.investigator.is_incapacitated:
-            border_color = (100, 30, 30)  # Dark red
-            border_width = 2
-        else:
-            border_color = config.COLOR_MENU_BORDER
-            border_width = 2
-
-        pygame.draw.rect(screen, border_color, self.rect, border_width)
+        pygame.draw.rect(surface, border_color, local_rect, border_width)
 
         # Draw portrait or symbol
         if self.portrait_image:
             # Draw the loaded portrait image
-            screen.blit(self.portrait_image, self.portrait_rect)
+            surface.blit(self.portrait_image, self._portrait_pos)
             # Draw border around portrait
-            pygame.draw.rect(screen, config.COLOR_MENU_BORDER, self.portrait_rect, 1)
+            pygame.draw.rect(surface, _COL_BORDER, portrait_rect, 1)
         else:
             # Draw symbol as fallback
             # Fill portrait area with dark background
-            pygame.draw.rect(screen, (30, 30, 40), self.portrait_rect)
-            pygame.draw.rect(screen, config.COLOR_MENU_BORDER, self.portrait_rect, 1)
-
-            # Draw emoji symbol centered
-            symbol_font = pygame.font.Font(None, 48)
-            symbol_surface = symbol_font.render(
-                self.investigator.symbol,
-                True,
-                config.COLOR_PLAYER
-            )
-            symbol_rect = symbol_surface.get_rect(center=self.portrait_rect.center)
-            screen.blit(symbol_surface, symbol_rect)
+            pygame.draw.rect(surface, (30, 30, 40), portrait_rect)
+            pygame.draw.rect(surface, _COL_BORDER, portrait_rect, 1)
 
-        # Draw name split over two lines (larger font for bigger tiles)
-        # Line 1: First name + nickname (if present)
-        # Line 2: Last name
-        name_font = pygame.font.Font(None, 38)  # Slightly smaller to fit 2 lines
-        name_color = config.COLOR_TEXT_DIM if self.investigator.is_incapacitated else config.COLOR_TEXT
-
-        # Parse name into first name (+ nickname) and last name
-        # Format can be "First Last" or "First 'Nick' Last"
-        full_name = self.investigator.name
-        name_parts = full_name.split()
-
-        # Check if there's a nickname (indicated by quotes)
-        has_nickname = any("'" in part for part in name_parts)
-
-        if has_nickname:
-            # Find the last name (everything after the closing quote)
-            # Example: "Arthur 'Bones' Blackwood" -> ["Arthur", "'Bones'", "Blackwood"]
-            quote_end_idx = None
-            for i, part in enumerate(name_parts):
-                if part.endswith("'"):
-                    quote_end_idx = i
-                    break
-
-            if quote_end_idx is not None and quote_end_idx + 1 < len(name_parts):
-                # Line 1: First name + nickname
-                first_line = " ".join(name_parts[:quote_end_idx + 1])
-                # Line 2: Last name (everything after nickname)
-                second_line = " ".join(name_parts[quote_end_idx + 1:])
-            else:
-                # Fallback: just split in half
-                mid = len(name_parts) // 2
-                first_line = " ".join(name_parts[:mid])
-                second_line = " ".join(name_parts[mid:])
+            # Draw emoji symbol centered (pre-rendered in __init__)
+            surface.blit(self._symbol_surface, self._symbol_pos)
+
+        # Draw name split over two lines (pre-rendered, see _render_name)
+        if self.investigator.name != self._cached_name:
+            self._render_name()
+        if self.investigator.is_incapacitated:
+            first_line_surface, second_line_surface = self._name_surfaces_dim
         else:
-            # No nickname: "First Last" or "First Middle Last"
-            if len(name_parts) >= 2:
-                # First name on line 1, last name on line 2
-                first_line = " ".join(name_parts[:-1])  # Everything except last word
-                second_line = name_parts[-1]  # Last word
-            else:
-                # Single word name (shouldn't happen, but handle it)
-                first_line = full_name
-                second_line = ""
+            first_line_surface, second_line_surface = self._name_surfaces
+
+        # Text lines don't overlap the bars, so they are collected here and
+        # copied in one fblits() call at the end instead of one blit each
+        text_blits = []
 
         # Draw first line (first name + optional nickname)
-        first_line_surface = name_font.render(first_line, True, name_color)
-        screen.blit(first_line_surface, (self.stats_x, self.stats_y))
+        text_blits.append((first_line_surface, (stats_x, name_y)))
 
         # Draw second line (last name) slightly below
-        if second_line:
-            second_line_surface = name_font.render(second_line, True, name_color)
-            screen.blit(second_line_surface, (self.stats_x, self.stats_y + 32))  # 32px below first line
+        if second_line_surface is not None:
+            text_blits.append((second_line_surface, (stats_x, name_y + 32)))  # 32px below first line
 
         # Draw health bar (larger bars for bigger tiles)
-        # Adjusted to account for two-line name
-        hp_y = self.stats_y + 70  # More spacing to fit 2 lines of text (was 50)
-        # Bar dimensions will be larger due to increased tile size
+        # Positioned below the two-line name (layout offsets from __init__)
         self._draw_resource_bar(
-            screen,
-            self.stats_x,
-            hp_y,
+            surface,
+            stats_x,
+            self._hp_y,
             self.bar_width,
-            int(self.bar_height * 1.3),  # Slightly taller bars
+            bar_height,
             self.investigator.current_health,
             self.investigator.max_health,
             (200, 50, 50),  # Red
@@ -870,13 +1901,12 @@ class InvestigatorTile:
         )
 
         # Draw sanity bar
-        san_y = hp_y + int(self.bar_height * 1.3) + 12  # More spacing (was 8)
         self._draw_resource_bar(
-            screen,
-            self.stats_x,
-            san_y,
+            surface,
+            stats_x,
+            self._san_y,
             self.bar_width,
-            int(self.bar_height * 1.3),  # Slightly taller bars
+            bar_height,
             self.investigator.current_sanity,
             self.investigator.max_sanity,
             (80, 120, 200),  # Blue
@@ -884,37 +1914,61 @@ class InvestigatorTile:
         )
 
         # Draw compact stats (accuracy, movement, will) with larger font
-        stats_y = san_y + int(self.bar_height * 1.3) + 18  # More spacing (was 12)
-        stat_font = pygame.font.Font(None, 32)  # Increased from 24
+        # The panel is also redrawn for hover/selection and bar changes, so
+        # the stat line is only rebuilt when one of its own values changed
+        investigator = self.investigator
+        stat_values = (
+            investigator.accuracy, investigator.movement_range,
+            investigator.will, investigator.is_incapacitated,
+        )
+        if stat_values != self._last_stat_values:
+            self._stat_blits = self._render_stat_line()
+            self._last_stat_values = stat_values
+        text_blits.extend(self._stat_blits)
+
+        # Draw incapacitated warning if needed (larger font)
+        if self.investigator.is_incapacitated:
+            warning_surface = _render_text(
+                "INCAPACITATED",
+                38,  # Increased from 28
+                (200, 50, 50)
+            )
+            # Centered near the bottom (more margin); the top-left corner is
+            # worked out directly instead of building a Rect to center it
+            center_x, center_y = local_rect.centerx, local_rect.bottom - 20
+            w, h = warning_surface.get_size()
+            text_blits.append((warning_surface, (center_x - w // 2, center_y - h // 2)))
+
+        surface.fblits(text_blits)
+
+    def _render_stat_line(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Render the ACC / MOV / WIL stat line.
+
+        Returns:
+            (surface, position) pairs, relative to the tile
+        """
+        stats_y = self._stats_y
+        stat_size = 32  # Increased from 24
 
         # Accuracy
         acc_text = f"ACC:{self.investigator.accuracy}%"
-        acc_color = config.COLOR_TEXT_DIM if self.investigator.is_incapacitated else config.COLOR_TEXT
-        acc_surface = stat_font.render(acc_text, True, acc_color)
-        screen.blit(acc_surface, (self.stats_x, stats_y))
+        acc_color = _COL_TEXT_DIM if self.investigator.is_incapacitated else _COL_TEXT
+        acc_surface = _render_text(acc_text, stat_size, acc_color)
 
         # Movement (more spacing for larger tiles)
         move_text = f"MOV:{self.investigator.movement_range}"
-        move_surface = stat_font.render(move_text, True, acc_color)
-        screen.blit(move_surface, (self.stats_x + 105, stats_y))  # Increased from 75
+        move_surface = _render_text(move_text, stat_size, acc_color)
 
         # Will
         will_text = f"WIL:{self.investigator.will}"
-        will_surface = stat_font.render(will_text, True, acc_color)
-        screen.blit(will_surface, (self.stats_x + 200, stats_y))  # Increased from 140
+        will_surface = _render_text(will_text, stat_size, acc_color)
 
-        # Draw incapacitated warning if needed (larger font)
-        if self.investigator.is_incapacitated:
-            warning_font = pygame.font.Font(None, 38)  # Increased from 28
-            warning_surface = warning_font.render(
-                "INCAPACITATED",
-                True,
-                (200, 50, 50)
-            )
-            warning_rect = warning_surface.get_rect(
-                center=(self.rect.centerx, self.rect.bottom - 20)  # More margin
-            )
-            screen.blit(warning_surface, warning_rect)
+        return [
+            (acc_surface, (self._text_x, stats_y)),
+            (move_surface, (self._move_x, stats_y)),
+            (will_surface, (self._will_x, stats_y)),
+        ]
 
     def _draw_resource_bar(
         self,
@@ -940,23 +1994,25 @@ class InvestigatorTile:
             bar_color: RGB color for filled portion
             label: Text label (e.g., "HP", "SAN")
         """
-        # Background (empty bar)
-        bg_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(screen, (40, 40, 50), bg_rect)
-        pygame.draw.rect(screen, (80, 80, 90), bg_rect, 1)
+        # Background (empty bar, pre-rendered in __init__ at width x height)
+        screen.blit(self._bar_bg, (x, y))
 
         # Filled portion (current value)
         if maximum > 0:
-            fill_width = int((current / maximum) * width)
-            fill_rect = pygame.Rect(x, y, fill_width, height)
+            # Integer math (no float division); values are never negative,
+            # so floor division matches int() truncation (minus float rounding)
+            fill_width = current * width // maximum
+            fill_rect = self._fill_rect
+            fill_rect.update(x, y, fill_width, height)
             pygame.draw.rect(screen, bar_color, fill_rect)
 
         # Draw text (e.g., "HP: 12/15") with larger font for bigger tiles
-        text_font = pygame.font.Font(None, 30)  # Increased from 22
         text = f"{label}: {current}/{maximum}"
-        text_surface = text_font.render(text, True, config.COLOR_TEXT)
-        text_rect = text_surface.get_rect(center=(x + width // 2, y + height // 2))
-        screen.blit(text_surface, text_rect)
+        text_surface = _render_text(text, 30, _COL_TEXT)  # Increased from 22
+        # Centered on the bar (same position get_rect(center=...) gives,
+        # without allocating a Rect)
+        w, h = text_surface.get_size()
+        screen.blit(text_surface, (x + width // 2 - w // 2, y + height // 2 - h // 2))
 
 
 class ActionButton:
@@ -967,6 +2023,11 @@ class ActionButton:
     Can be in enabled, disabled, or cooldown states.
     """
 
+    # Pre-rendered frames: index = is_pressed * 2 + is_hovered for an
+    # enabled button, plus one frame for the disabled appearance
+    _FRAME_COUNT = 5
+    _DISABLED_FRAME = 4
+
     def __init__(
         self,
         x: int,
@@ -976,7 +2037,8 @@ class ActionButton:
         icon: str = "",
         on_click: Optional[Callable] = None,
         enabled: bool = True,
-        hotkey: str = ""
+        hotkey: str = "",
+        slot_index: int = 0
     ):
         """
         Initialize an action button.
@@ -986,16 +2048,22 @@ class ActionButton:
             size: Width and height (square button)
             text: Text label for the action
             icon: Icon/emoji symbol (if available)
-            on_click: Callback when button is clicked
+            on_click: Callback function(slot_index) when button is clicked
             enabled: Whether button can be clicked
             hotkey: Keyboard shortcut (e.g., "1", "2", etc.)
+            slot_index: Position of the button in its action bar (passed to on_click)
         """
+        # Pre-rendered appearance for every state (built on first draw,
+        # rebuilt whenever text, icon or enabled changes)
+        self._frames = None
+
         self.rect = pygame.Rect(x, y, size, size)
-        self.text = text
-        self.icon = icon
+        self._text = text  # Backing fields for the text/icon/enabled properties
+        self._icon = icon
         self.on_click = on_click
-        self.enabled = enabled
+        self._enabled = enabled
         self.hotkey = hotkey
+        self.slot_index = slot_index
 
         # Visual state
         self.is_hovered = False
@@ -1009,6 +2077,43 @@ class ActionButton:
         self.color_border = config.COLOR_MENU_BORDER
         self.color_border_hover = config.COLOR_TEXT_HIGHLIGHT
 
+    # ActionBar changes text, icon and enabled directly when the turn unit
+    # changes, so these are properties that drop the pre-rendered frames
+    # (see _current_frame) - but only if the value actually changed
+
+    @property
+    def text(self) -> str:
+        """Text label for the action."""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        if value != self._text:
+            self._text = value
+            self._frames = None
+
+    @property
+    def icon(self) -> str:
+        """Icon/emoji symbol for the action."""
+        return self._icon
+
+    @icon.setter
+    def icon(self, value: str) -> None:
+        if value != self._icon:
+            self._icon = value
+            self._frames = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the button can be clicked."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if value != self._enabled:
+            self._enabled = value
+            self._frames = None
+
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """Update hover state based on mouse position."""
         if self.enabled:
@@ -1023,19 +2128,22 @@ class ActionButton:
         Returns:
             True if button was clicked, False otherwise
         """
-        if not self.enabled:
+        # Most events (keyboard, mouse motion) are not clicks: reject them
+        # with a single set lookup before anything else (see Button)
+        event_type = event.type
+        if event_type not in _DOWN_UP or event.button != 1 or not self.enabled:
             return False
 
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if event_type == pygame.MOUSEBUTTONDOWN:
             if self.is_hovered:
                 self.is_pressed = True
                 return False
 
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+        else:
             if self.is_hovered and self.is_pressed:
                 self.is_pressed = False
                 if self.on_click:
-                    self.on_click()
+                    self.on_click(self.slot_index)
                 return True
             self.is_pressed = False
 
@@ -1050,62 +2158,134 @@ class ActionButton:
         Draw the action button.
 
         Shows icon/text, hotkey number, and visual state.
+        Every state is pre-rendered (see _render_frame), so drawing the
+        button is a single blit.
         """
-        # Background color based on state
+        screen.blit(self._current_frame(), self.rect.topleft)
+
+    def compose_surfaces(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Get the (surface, position) pairs that make up the button.
+
+        Nothing is drawn here, so ActionBar can draw all of its buttons with
+        a single fblits() call. The whole button is one pre-rendered frame.
+
+        Returns:
+            List of (surface, screen position) pairs
+        """
+        return [(self._current_frame(), self.rect.topleft)]
+
+    def _current_frame(self) -> pygame.Surface:
+        """Get the pre-rendered frame for the button's current state."""
+        if self._frames is None:
+            self._frames = tuple(self._render_frame(state) for state in range(self._FRAME_COUNT))
+
         if not self.enabled:
+            return self._frames[self._DISABLED_FRAME]
+        return self._frames[self.is_pressed * 2 + self.is_hovered]
+
+    def _content_rects(
+        self,
+        local_rect: pygame.Rect,
+        icon_surface: Optional[pygame.Surface],
+        text_surface: Optional[pygame.Surface]
+    ) -> Tuple[Optional[pygame.Rect], Optional[pygame.Rect]]:
+        """
+        Place the icon and text label inside the button.
+
+        Args:
+            local_rect: Button area at (0, 0)
+            icon_surface: Rendered icon, or None if the button has no icon
+            text_surface: Rendered label, or None if the button has no text
+
+        Returns:
+            (icon_rect, text_rect), None for a missing surface
+        """
+        # Icon centered in the button
+        icon_rect = None
+        if icon_surface is not None:
+            icon_rect = icon_surface.get_rect(center=local_rect.center)
+
+        # Text label below the icon, or centered if there is no icon
+        text_rect = None
+        if text_surface is not None:
+            if icon_surface is not None:
+                text_rect = text_surface.get_rect(
+                    centerx=local_rect.centerx,
+                    bottom=local_rect.bottom - 5
+                )
+            else:
+                text_rect = text_surface.get_rect(center=local_rect.center)
+
+        return icon_rect, text_rect
+
+    def _render_frame(self, state: int) -> pygame.Surface:
+        """
+        Render the button's appearance for one state into a new surface.
+
+        Layers in drawing order: background, border, icon, text label and
+        hotkey number.
+
+        Args:
+            state: Frame index (see _FRAME_COUNT)
+
+        Returns:
+            Surface the size of the button
+        """
+        enabled = state != self._DISABLED_FRAME
+        is_pressed = enabled and bool(state & 2)
+        is_hovered = enabled and bool(state & 1)
+
+        surface = pygame.Surface(self.rect.size)
+        local_rect = surface.get_rect()  # Same size as self.rect, at (0, 0)
+
+        # Background color based on state
+        if not enabled:
             bg_color = self.color_disabled
-        elif self.is_pressed:
+        elif is_pressed:
             bg_color = self.color_active
-        elif self.is_hovered:
+        elif is_hovered:
             bg_color = self.color_hover
         else:
             bg_color = self.color_normal
 
         # Draw background
-        pygame.draw.rect(screen, bg_color, self.rect)
+        surface.fill(bg_color)
 
         # Draw border
-        if self.is_hovered and self.enabled:
+        if is_hovered:
             border_color = self.color_border_hover
             border_width = 3
         else:
             border_color = self.color_border
             border_width = 2
 
-        pygame.draw.rect(screen, border_color, self.rect, border_width)
+        pygame.draw.rect(surface, border_color, local_rect, border_width)
 
-        # Draw icon if available
-        if self.icon:
-            icon_font = pygame.font.Font(None, self.rect.height // 2)
-            text_color = config.COLOR_TEXT if self.enabled else config.COLOR_TEXT_DIM
-            icon_surface = icon_font.render(self.icon, True, text_color)
-            icon_rect = icon_surface.get_rect(center=self.rect.center)
-            screen.blit(icon_surface, icon_rect)
+        text_color = _COL_TEXT if enabled else _COL_TEXT_DIM
 
-        # Draw text label (below icon or centered if no icon)
+        icon_surface = text_surface = None
+        if self.icon:
+            icon_surface = _render_text(self.icon, local_rect.height // 2, text_color)
         if self.text:
-            text_font = pygame.font.Font(None, 22)
-            text_color = config.COLOR_TEXT if self.enabled else config.COLOR_TEXT_DIM
-            text_surface = text_font.render(self.text, True, text_color)
+            text_surface = _render_text(self.text, 22, text_color)
+        icon_rect, text_rect = self._content_rects(local_rect, icon_surface, text_surface)
 
-            if self.icon:
-                # Position below icon
-                text_rect = text_surface.get_rect(
-                    centerx=self.rect.centerx,
-                    bottom=self.rect.bottom - 5
-                )
-            else:
-                # Center in button
-                text_rect = text_surface.get_rect(center=self.rect.center)
+        # Draw icon if available
+        if icon_surface is not None:
+            surface.blit(icon_surface, icon_rect)
 
-            screen.blit(text_surface, text_rect)
+        # Draw text label (below icon or centered if no icon)
+        if text_surface is not None:
+            surface.blit(text_surface, text_rect)
 
         # Draw hotkey number in top-left corner
         if self.hotkey:
-            hotkey_font = pygame.font.Font(None, 18)
-            hotkey_color = config.COLOR_TEXT_HIGHLIGHT if self.enabled else config.COLOR_TEXT_DIM
-            hotkey_surface = hotkey_font.render(self.hotkey, True, hotkey_color)
-            screen.blit(hotkey_surface, (self.rect.x + 3, self.rect.y + 2))
+            hotkey_color = _COL_TEXT_HL if enabled else _COL_TEXT_DIM
+            hotkey_surface = _render_text(self.hotkey, 18, hotkey_color)
+            surface.blit(hotkey_surface, (3, 2))
+
+        return _to_display_format(surface, alpha=False)
 
 
 class TurnOrderTracker:
@@ -1342,6 +2522,57 @@ class TurnOrderTracker:
 
 
 
+class UILayer:
+    """
+    Off-screen surface for a mostly static group of UI elements.
+
+    The group is drawn into the layer only when something changed
+    (mark_dirty()); every other frame the whole group is one blit.
+
+    Usage:
+        if layer.dirty:
+            surface = layer.begin()  # Cleared, coordinates relative to layer.rect
+            ... draw the elements onto surface ...
+        layer.draw(screen)
+    """
+
+    __slots__ = ('rect', 'background', 'surface', 'dirty')
+
+    def __init__(self, rect: pygame.Rect, background: Tuple[int, int, int] = None):
+        """
+        Initialize a UI layer.
+
+        Args:
+            rect: Screen area covered by the layer
+            background: Fill color behind the elements (defaults to the screen background)
+        """
+        self.rect = pygame.Rect(rect)
+        self.background = background if background else config.COLOR_BG
+        self.surface = None  # Created on first begin() (needs the display mode)
+        self.dirty = True
+
+    def mark_dirty(self) -> None:
+        """Redraw the layer's contents before it is next drawn."""
+        self.dirty = True
+
+    def begin(self) -> pygame.Surface:
+        """
+        Clear the layer for redrawing its contents.
+
+        Returns:
+            The layer surface (position (0, 0) is self.rect.topleft)
+        """
+        if self.surface is None:
+            self.surface = _to_display_format(pygame.Surface(self.rect.size), alpha=False)
+        self.surface.fill(self.background)
+        self.dirty = False
+        return self.surface
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Blit the layer onto the screen."""
+        screen.blit(self.surface, self.rect.topleft)
+
+
 class ActionBar:
     """
     Action bar displaying 10 ability/action slots.
@@ -1367,7 +2598,7 @@ class ActionBar:
         self.on_action_click_callback = on_action_click
 
         # Create 10 action button slots
-        self.action_buttons: List[ActionButton] = []
+        buttons = []
         for i in range(10):
             button_x = x + (i * (button_size + spacing))
             button_y = y
@@ -1379,11 +2610,36 @@ class ActionBar:
                 y=button_y,
                 size=button_size,
                 text="",
-                on_click=lambda idx=i: self._on_action_click(idx),
+                on_click=self._on_action_click,  # Called with the slot index
                 enabled=False,
-                hotkey=hotkey
+                hotkey=hotkey,
+                slot_index=i
             )
-            self.action_buttons.append(button)
+            buttons.append(button)
+
+        # The slots never change after this, so they are stored as a tuple
+        # (iterated in update, draw and for every event)
+        self.action_buttons: Tuple[ActionButton, ...] = tuple(buttons)
+
+        # Buttons that can currently be clicked (rebuilt by
+        # update_for_investigator), so events skip the disabled slots
+        self._active_buttons: Tuple[ActionButton, ...] = ()
+
+        # Number key -> slot index (keys 1-9 are slots 0-8, key 0 is slot 9)
+        self._hotkey_slots = {pygame.K_1 + i: i for i in range(9)}
+        self._hotkey_slots[pygame.K_0] = 9
+
+        # Skip update() while the mouse is still (reset when buttons change)
+        self._last_mouse_pos = None
+
+        # Bounds of the whole bar: no button can be hovered outside it
+        bar_width = len(self.action_buttons) * (button_size + spacing) - spacing
+        self._bbox = (x, y, x + bar_width, y + button_size)
+        self._hovered_button = None  # Button currently hovered (if any)
+
+        # The bar is drawn into its own layer, and only redrawn when a
+        # button's appearance changed (hover, press, new actions)
+        self._layer = UILayer(pygame.Rect(x, y, bar_width, button_size))
 
         # Current investigator
         self.current_investigator = None
@@ -1428,6 +2684,12 @@ class ActionBar:
                 button.icon = ""
                 button.enabled = False
 
+        self._active_buttons = tuple(button for button in self.action_buttons if button.enabled)
+
+        # Enabled buttons changed, so hover states must be re-checked
+        self._last_mouse_pos = None
+        self._layer.mark_dirty()
+
     def clear(self) -> None:
         """Clear the action bar (no investigator selected)."""
         self.update_for_investigator(None)
@@ -1447,8 +2709,30 @@ class ActionBar:
 
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """Update hover states for all action buttons."""
+        # Hover states can't change while the mouse stays put
+        if mouse_pos == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = mouse_pos
+
+        # Mouse outside the bar (e.g. over the grid): nothing is hovered,
+        # and if nothing was hovered before there is nothing to clear
+        mx, my = mouse_pos
+        left, top, right, bottom = self._bbox
+        if not (left <= mx < right and top <= my < bottom):
+            if self._hovered_button is not None:
+                self._hovered_button.is_hovered = False
+                self._hovered_button = None
+                self._layer.mark_dirty()
+            return
+
+        hovered_button = None
         for button in self.action_buttons:
             button.update(mouse_pos)
+            if button.is_hovered:
+                hovered_button = button
+        if hovered_button is not self._hovered_button:
+            self._hovered_button = hovered_button
+            self._layer.mark_dirty()
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -1457,29 +2741,52 @@ class ActionBar:
         Returns:
             True if any button consumed the event, False otherwise
         """
-        for button in self.action_buttons:
-            if button.handle_event(event):
-                return True
+        event_type = event.type
 
-        # Handle hotkey presses (1-0 keys)
-        if event.type == pygame.KEYDOWN:
-            # Number keys 1-0 (SDLK keys 49-57 for 1-9, 48 for 0)
-            if pygame.K_1 <= event.key <= pygame.K_9:
-                slot_index = event.key - pygame.K_1  # 0-8
-                if self.action_buttons[slot_index].enabled:
-                    self._on_action_click(slot_index)
-                    return True
-            elif event.key == pygame.K_0:
-                if self.action_buttons[9].enabled:
-                    self._on_action_click(9)
+        # Only mouse button presses/releases can click a button
+        # (disabled buttons ignore clicks, so only the active ones are asked)
+        if event_type in _DOWN_UP:
+            self._layer.mark_dirty()  # A button may be pressed or released
+            for button in self._active_buttons:
+                if button.handle_event(event):
                     return True
+            return False
+
+        # Handle hotkey presses (1-0 keys)
+        if event_type == pygame.KEYDOWN:
+            slot_index = self._hotkey_slots.get(event.key)
+            if slot_index is not None and self.action_buttons[slot_index].enabled:
+                self._on_action_click(slot_index)
+                return True
 
         return False
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw all action buttons."""
-        for button in self.action_buttons:
-            button.draw(screen)
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        Draw all action buttons.
+
+        The buttons are drawn into the bar's layer only when one of them
+        changed; otherwise the whole bar is a single blit of the layer.
+        When redrawing, every button's surfaces are copied in one fblits()
+        call instead of several blits per button.
+
+        Returns:
+            The bar's rect if its appearance changed this frame, else None
+            (for pygame.display.update(rects) in loops that track changes)
+        """
+        layer = self._layer
+        changed = None
+        if layer.dirty:
+            changed = layer.rect
+            surface = layer.begin()
+            layer_x, layer_y = layer.rect.topleft
+            pairs = []
+            for button in self.action_buttons:
+                for button_surface, (px, py) in button.compose_surfaces():
+                    pairs.append((button_surface, (px - layer_x, py - layer_y)))
+            surface.fblits(pairs)
+        layer.draw(screen)
+        return changed
 
 
 class ActionPointsDisplay: